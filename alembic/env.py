@@ -11,7 +11,7 @@ from app.config import settings
 from app.db.base import Base
 
 # Import all models so they're registered with Base.metadata
-from app.models import User, SimulationJob, Report
+from app.models import User, SimulationJob, Report, ReportSimulation
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
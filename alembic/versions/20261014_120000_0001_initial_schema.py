@@ -0,0 +1,111 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-14 12:00:00
+
+Schema as first shipped, when tables were only created by
+Base.metadata.create_all. Databases created that way already match
+it; the existence checks turn this revision into a no-op for them.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.db.migrations import has_table
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+simulation_status = sa.Enum(
+    "PENDING", "RUNNING", "COMPLETED", "FAILED", "CANCELLED", name="simulation_status"
+)
+report_status = sa.Enum("PENDING", "GENERATING", "COMPLETED", "FAILED", name="report_status")
+
+
+def upgrade() -> None:
+    if not has_table("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("email", sa.String(255), nullable=False),
+            sa.Column("hashed_password", sa.String(255), nullable=False),
+            sa.Column("full_name", sa.String(255), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.Column("is_superuser", sa.Boolean(), nullable=True),
+            sa.Column("external_id", sa.String(255), nullable=True, unique=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    if not has_table("simulation_jobs"):
+        op.create_table(
+            "simulation_jobs",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                "user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False
+            ),
+            sa.Column("simulation_type", sa.String(255), nullable=False),
+            sa.Column("status", simulation_status, nullable=False),
+            sa.Column("progress", sa.Numeric(5, 4), nullable=True),
+            sa.Column("parameters", postgresql.JSONB(), nullable=False),
+            sa.Column("parameters_s3_key", sa.String(512), nullable=True),
+            sa.Column("result_s3_key", sa.String(512), nullable=True),
+            sa.Column("result_size_bytes", sa.BigInteger(), nullable=True),
+            sa.Column("error_code", sa.String(100), nullable=True),
+            sa.Column("error_message", sa.Text(), nullable=True),
+            sa.Column("job_metadata", postgresql.JSONB(), nullable=False),
+            sa.Column("callback_url", sa.String(2048), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_simulation_jobs_user_id", "simulation_jobs", ["user_id"])
+        op.create_index("ix_simulation_jobs_simulation_type", "simulation_jobs", ["simulation_type"])
+        op.create_index("ix_simulation_jobs_status", "simulation_jobs", ["status"])
+        op.create_index("ix_simulation_jobs_created_at", "simulation_jobs", ["created_at"])
+
+    if not has_table("reports"):
+        op.create_table(
+            "reports",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                "user_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=False
+            ),
+            sa.Column("report_type", sa.String(255), nullable=False),
+            sa.Column("output_format", sa.String(50), nullable=False),
+            sa.Column("status", report_status, nullable=False),
+            sa.Column(
+                "simulation_job_ids", postgresql.ARRAY(postgresql.UUID(as_uuid=True)), nullable=False
+            ),
+            sa.Column("parameters", postgresql.JSONB(), nullable=False),
+            sa.Column("s3_key", sa.String(512), nullable=True),
+            sa.Column("content_type", sa.String(100), nullable=True),
+            sa.Column("size_bytes", sa.BigInteger(), nullable=True),
+            sa.Column("error_code", sa.String(100), nullable=True),
+            sa.Column("error_message", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_reports_user_id", "reports", ["user_id"])
+        op.create_index("ix_reports_report_type", "reports", ["report_type"])
+        op.create_index("ix_reports_status", "reports", ["status"])
+        op.create_index("ix_reports_created_at", "reports", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_table("reports")
+    op.drop_table("simulation_jobs")
+    op.drop_table("users")
+    report_status.drop(op.get_bind(), checkfirst=True)
+    simulation_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,36 @@
+"""report download url
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-14 12:01:00
+
+Stores the presigned download URL signed when a report completes.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migrations import has_column
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_column("reports", "download_url"):
+        op.add_column("reports", sa.Column("download_url", sa.String(2048), nullable=True))
+    if not has_column("reports", "url_expires_at"):
+        op.add_column(
+            "reports", sa.Column("url_expires_at", sa.DateTime(timezone=True), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("reports", "url_expires_at")
+    op.drop_column("reports", "download_url")
@@ -0,0 +1,96 @@
+"""report simulations join table
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-14 12:02:00
+
+Moves report source ids from the reports.simulation_job_ids UUID[]
+column into report_simulations, keeping their order and dropping
+duplicates, then drops the array column.
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.db.migrations import has_column, has_index, has_table
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_table("report_simulations"):
+        op.create_table(
+            "report_simulations",
+            sa.Column(
+                "report_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("reports.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column(
+                "simulation_job_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("simulation_jobs.id"),
+                primary_key=True,
+            ),
+            sa.Column("position", sa.Integer(), nullable=False),
+        )
+    if not has_index("report_simulations", "ix_report_simulations_simulation_job_id"):
+        op.create_index(
+            "ix_report_simulations_simulation_job_id",
+            "report_simulations",
+            ["simulation_job_id"],
+        )
+
+    if context.is_offline_mode() or has_column("reports", "simulation_job_ids"):
+        # Each id keeps the position of its first occurrence, so order is
+        # preserved and duplicates collapse; ids whose job no longer
+        # exists can't satisfy the foreign key and are skipped
+        op.execute(
+            """
+            INSERT INTO report_simulations (report_id, simulation_job_id, position)
+            SELECT r.id, ids.simulation_job_id, min(ids.ordinality) - 1
+            FROM reports r
+            CROSS JOIN LATERAL unnest(r.simulation_job_ids)
+                WITH ORDINALITY AS ids(simulation_job_id, ordinality)
+            JOIN simulation_jobs s ON s.id = ids.simulation_job_id
+            GROUP BY r.id, ids.simulation_job_id
+            ON CONFLICT (report_id, simulation_job_id) DO NOTHING
+            """
+        )
+        op.drop_column("reports", "simulation_job_ids")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "reports",
+        sa.Column(
+            "simulation_job_ids",
+            postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+            nullable=False,
+            server_default="{}",
+        ),
+    )
+    op.execute(
+        """
+        UPDATE reports r
+        SET simulation_job_ids = links.ids
+        FROM (
+            SELECT report_id, array_agg(simulation_job_id ORDER BY position) AS ids
+            FROM report_simulations
+            GROUP BY report_id
+        ) links
+        WHERE links.report_id = r.id
+        """
+    )
+    op.alter_column("reports", "simulation_job_ids", server_default=None)
+    op.drop_index("ix_report_simulations_simulation_job_id", table_name="report_simulations")
+    op.drop_table("report_simulations")
@@ -0,0 +1,41 @@
+"""updated_at on jobs and reports
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-14 12:03:00
+
+Modification timestamps used to build ETags for polled endpoints.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migrations import has_column
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ("simulation_jobs", "reports"):
+        if not has_column(table, "updated_at"):
+            op.add_column(
+                table,
+                sa.Column(
+                    "updated_at",
+                    sa.DateTime(timezone=True),
+                    server_default=sa.func.now(),
+                    nullable=False,
+                ),
+            )
+
+
+def downgrade() -> None:
+    op.drop_column("reports", "updated_at")
+    op.drop_column("simulation_jobs", "updated_at")
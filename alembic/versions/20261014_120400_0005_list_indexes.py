@@ -0,0 +1,68 @@
+"""composite list indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-14 12:04:00
+
+Owner + newest-first indexes for the list endpoints, built
+concurrently so the tables stay writable. The single-column user_id
+indexes are dropped, since each composite leads with user_id.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = {
+    "reports": {
+        "ix_reports_user_created": ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        "ix_reports_user_status_created": [
+            "user_id", "status", sa.text("created_at DESC"), sa.text("id DESC"),
+        ],
+    },
+    "simulation_jobs": {
+        "ix_simulation_jobs_user_created": ["user_id", sa.text("created_at DESC")],
+        "ix_simulation_jobs_user_status_created": ["user_id", "status", sa.text("created_at DESC")],
+    },
+}
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        for table, indexes in _INDEXES.items():
+            for name, columns in indexes.items():
+                op.create_index(
+                    name, table, columns, postgresql_concurrently=True, if_not_exists=True
+                )
+            op.drop_index(
+                f"ix_{table}_user_id",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, indexes in _INDEXES.items():
+            op.create_index(
+                f"ix_{table}_user_id",
+                table,
+                ["user_id"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            for name in indexes:
+                op.drop_index(
+                    name, table_name=table, postgresql_concurrently=True, if_exists=True
+                )
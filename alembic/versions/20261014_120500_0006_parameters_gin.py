@@ -0,0 +1,50 @@
+"""GIN indexes on parameters
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-14 12:05:00
+
+jsonb_path_ops GIN indexes so containment filters such as
+parameters @> '{"region": "eu"}' stop scanning the whole table. Only
+@> uses them. They are built concurrently; run ANALYZE on both tables
+afterwards so the planner picks them up.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = {
+    "simulation_jobs": "ix_simulation_jobs_parameters_gin",
+    "reports": "ix_reports_parameters_gin",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, name in _INDEXES.items():
+            op.create_index(
+                name,
+                table,
+                ["parameters"],
+                postgresql_using="gin",
+                postgresql_ops={"parameters": "jsonb_path_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, name in _INDEXES.items():
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
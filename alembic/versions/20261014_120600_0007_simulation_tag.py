@@ -0,0 +1,60 @@
+"""promote job_metadata tag to a column
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-14 12:06:00
+
+simulation_jobs.tag holds a copy of job_metadata->>'tag' so tag
+filters use a plain (user_id, tag, created_at) index instead of a JSONB
+operator. job_metadata remains the source of truth; only string tags
+that fit the column are copied.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migrations import has_column
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_column("simulation_jobs", "tag"):
+        op.add_column("simulation_jobs", sa.Column("tag", sa.String(64), nullable=True))
+
+    op.execute(
+        """
+        UPDATE simulation_jobs
+        SET tag = job_metadata->>'tag'
+        WHERE tag IS NULL
+          AND jsonb_typeof(job_metadata->'tag') = 'string'
+          AND length(job_metadata->>'tag') <= 64
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_simulation_jobs_user_tag_created",
+            "simulation_jobs",
+            ["user_id", "tag", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_simulation_jobs_user_tag_created",
+            table_name="simulation_jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("simulation_jobs", "tag")
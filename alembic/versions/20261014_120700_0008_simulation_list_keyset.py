@@ -0,0 +1,61 @@
+"""keyset pagination indexes for simulation_jobs
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-14 12:07:00
+
+The simulation list pages by (created_at, id), so id is appended to
+each owner-scoped list index. Each index is rebuilt concurrently under
+a temporary name, the old one is dropped, and the new one takes its
+name, so the table keeps an index throughout.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_INDEXES = {
+    "ix_simulation_jobs_user_created": ["user_id"],
+    "ix_simulation_jobs_user_status_created": ["user_id", "status"],
+    "ix_simulation_jobs_user_tag_created": ["user_id", "tag"],
+}
+
+
+def _rebuild(with_id: bool) -> None:
+    # CREATE/DROP INDEX CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, prefix in _INDEXES.items():
+            columns = [*prefix, sa.text("created_at DESC")]
+            if with_id:
+                columns.append(sa.text("id DESC"))
+            op.create_index(
+                f"{name}_new",
+                "simulation_jobs",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                name,
+                table_name="simulation_jobs",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+            op.execute(f"ALTER INDEX {name}_new RENAME TO {name}")
+
+
+def upgrade() -> None:
+    _rebuild(with_id=True)
+
+
+def downgrade() -> None:
+    _rebuild(with_id=False)
@@ -1,12 +1,15 @@
 """Authentication endpoints."""
 
+from typing import Annotated
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.api.v1.dependencies import get_user_service, get_current_user
+from app.api.v1.deps_types import CurrentUser, UserServiceDep
 from app.services.user_service import UserService
 from app.services.exceptions import AuthenticationError
-from app.schemas.user import UserCreate, UserResponse, Token
+from app.schemas.user import UserCreate, LoginRequest, UserResponse, Token
 from app.models.user import User
 
 router = APIRouter()
@@ -19,39 +22,26 @@ router = APIRouter()
     summary="Register a new user",
     description="Create a new user account with email and password.",
 )
-def register_user(
+async def register_user(
     data: UserCreate,
-    user_service: UserService = Depends(get_user_service),
+    user_service: UserServiceDep,
 ) -> User:
     """Register a new user."""
     # Check if user already exists
-    existing_user = user_service.get_user_by_email(data.email)
+    existing_user = await run_in_threadpool(user_service.get_user_by_email, data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="User with this email already exists",
         )
     
-    return user_service.create_user(data)
+    return await run_in_threadpool(user_service.create_user, data)
 
 
-@router.post(
-    "/login",
-    response_model=Token,
-    summary="Login to get access token",
-    description="Authenticate with email and password to receive a JWT access token.",
-)
-def login(
-    form_data: OAuth2PasswordRequestForm = Depends(),
-    user_service: UserService = Depends(get_user_service),
-) -> dict:
-    """
-    Login and get access token.
-    
-    Uses OAuth2 password flow - username field should contain email.
-    """
+async def _issue_token(user_service: UserService, email: str, password: str) -> dict:
+    """Authenticate credentials and build the token response."""
     try:
-        user = user_service.authenticate_user(form_data.username, form_data.password)
+        user = await run_in_threadpool(user_service.authenticate_user, email, password)
         access_token = user_service.create_access_token(user.id)
         
         return {"access_token": access_token, "token_type": "bearer"}
@@ -64,14 +54,46 @@ def login(
         )
 
 
+@router.post(
+    "/login",
+    response_model=Token,
+    summary="Login to get access token",
+    description="Authenticate with a JSON body of email and password to receive a JWT access token.",
+)
+async def login(
+    data: LoginRequest,
+    user_service: UserServiceDep,
+) -> dict:
+    """Login and get access token."""
+    return await _issue_token(user_service, data.email, data.password)
+
+
+@router.post(
+    "/login/form",
+    response_model=Token,
+    summary="Login with an OAuth2 password form",
+    description="Form-encoded alias of /login for OAuth2 password flow clients.",
+)
+async def login_form(
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    user_service: UserServiceDep,
+) -> dict:
+    """
+    Login and get access token.
+    
+    Uses OAuth2 password flow - username field should contain email.
+    """
+    return await _issue_token(user_service, form_data.username, form_data.password)
+
+
 @router.get(
     "/me",
     response_model=UserResponse,
     summary="Get current user",
     description="Get the currently authenticated user's information.",
 )
-def get_me(
-    current_user: User = Depends(get_current_user),
-) -> User:
+async def get_me(
+    current_user: CurrentUser,
+) -> UserResponse:
     """Get current user information."""
-    return current_user
+    return UserResponse.model_validate(current_user)
@@ -1,27 +1,33 @@
 """API dependencies for dependency injection."""
 
-from typing import Generator
+from typing import Generator, Optional
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from app.api.v1.token_cache import CachedUser, get_cached_token, cache_token
 from app.db.session import get_db
-from app.storage.blob_storage import S3Storage, BlobStorage
+from app.storage.blob_storage import BlobStorage
+from app.storage.result_cache import ResultCache
 from app.services.simulation_service import SimulationService
 from app.services.report_service import ReportService
-from app.services.user_service import UserService
+from app.services.user_service import UserService, TokenVerifier, token_verifier
 from app.services.exceptions import AuthenticationError
-from app.models.user import User
 
 # Security scheme for JWT
 security = HTTPBearer()
 
 
-def get_blob_storage() -> BlobStorage:
-    """Get blob storage client."""
-    return S3Storage()
+def get_blob_storage(request: Request) -> BlobStorage:
+    """Get the blob storage client created at application startup."""
+    return request.app.state.blob_storage
+
+
+def get_result_cache(request: Request) -> Optional[ResultCache]:
+    """Get the result cache created at application startup, if enabled."""
+    return request.app.state.result_cache
 
 
 def get_user_service(db: Session = Depends(get_db)) -> UserService:
@@ -29,12 +35,18 @@ def get_user_service(db: Session = Depends(get_db)) -> UserService:
     return UserService(db)
 
 
+def get_token_verifier() -> TokenVerifier:
+    """Get the shared token verifier."""
+    return token_verifier
+
+
 def get_simulation_service(
     db: Session = Depends(get_db),
     blob_storage: BlobStorage = Depends(get_blob_storage),
+    result_cache: Optional[ResultCache] = Depends(get_result_cache),
 ) -> SimulationService:
     """Get simulation service instance."""
-    return SimulationService(db, blob_storage)
+    return SimulationService(db, blob_storage, result_cache)
 
 
 def get_report_service(
@@ -45,52 +57,69 @@ def get_report_service(
     return ReportService(db, blob_storage)
 
 
+def _ensure_active(user: CachedUser) -> CachedUser:
+    """Reject disabled accounts."""
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is disabled",
+        )
+    return user
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    user_service: UserService = Depends(get_user_service),
-) -> User:
+    db: Session = Depends(get_db),
+    verifier: TokenVerifier = Depends(get_token_verifier),
+) -> CachedUser:
     """
     Get the current authenticated user from JWT token.
     
+    Tokens verified within the last few seconds are served from the
+    token cache, skipping both signature verification and the user
+    lookup. A disabled account can therefore keep working for up to
+    JWT_CACHE_TTL seconds.
+    
     Args:
         credentials: HTTP Bearer credentials
-        user_service: User service instance
+        db: Database session, used only on a cache miss
+        verifier: Shared token verifier
         
     Returns:
-        Current User instance
+        Snapshot of the current user
         
     Raises:
         HTTPException: If authentication fails
     """
+    token = credentials.credentials
+    cached = get_cached_token(token)
+    
+    if cached:
+        return _ensure_active(cached.user)
+    
     try:
-        token = credentials.credentials
-        payload = user_service.verify_token(token)
-        
-        if not payload.sub:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token payload",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        
-        user = user_service.get_user_by_id(UUID(payload.sub))
-        
-        if not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="User account is disabled",
-            )
-        
-        return user
-        
+        payload = verifier.verify(token)
     except AuthenticationError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e.message),
             headers={"WWW-Authenticate": "Bearer"},
         )
+    
+    if not payload.sub:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    user = UserService(db).get_user_by_id(UUID(payload.sub))
+    
+    return _ensure_active(cache_token(token, payload, user))
 
 
-def get_current_user_id(current_user: User = Depends(get_current_user)) -> UUID:
+def get_current_user_id(
+    current_user: CachedUser = Depends(get_current_user),
+) -> UUID:
     """Get the current user's ID."""
     return current_user.id
@@ -0,0 +1,25 @@
+"""Annotated dependency aliases for endpoint signatures."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends
+
+from app.api.v1.token_cache import CachedUser
+from app.api.v1.dependencies import (
+    get_current_user,
+    get_current_user_id,
+    get_report_service,
+    get_simulation_service,
+    get_user_service,
+)
+from app.services.report_service import ReportService
+from app.services.simulation_service import SimulationService
+from app.services.user_service import UserService
+
+CurrentUser = Annotated[CachedUser, Depends(get_current_user)]
+CurrentUserId = Annotated[UUID, Depends(get_current_user_id)]
+
+UserServiceDep = Annotated[UserService, Depends(get_user_service)]
+SimulationServiceDep = Annotated[SimulationService, Depends(get_simulation_service)]
+ReportServiceDep = Annotated[ReportService, Depends(get_report_service)]
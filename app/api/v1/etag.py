@@ -0,0 +1,46 @@
+"""Conditional GET helpers for polled status endpoints."""
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(state: Enum, updated_at: Optional[datetime]) -> str:
+    """
+    Build an ETag from a row's status and last modification time.
+
+    Microsecond precision is used so progress updates that land within
+    the same second still produce a new tag.
+
+    Args:
+        state: Current status enum member
+        updated_at: Row modification timestamp
+
+    Returns:
+        Quoted strong ETag value
+    """
+    stamp = int(updated_at.timestamp() * 1_000_000) if updated_at else 0
+    return f'"{state.value}-{stamp}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Check the request's If-None-Match header against an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        A 304 response if the client's copy is current, otherwise None
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
@@ -0,0 +1,56 @@
+"""Opaque keyset cursors for list endpoints."""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+Cursor = tuple[datetime, UUID]
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """
+    Encode a (created_at, id) position as an opaque cursor string.
+
+    Args:
+        cursor: Sort key of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    created_at, row_id = cursor
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(value: Optional[str]) -> Optional[Cursor]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        value: Cursor string from the query string, if any
+
+    Returns:
+        (created_at, id) tuple, or None if no cursor was given
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    if not value:
+        return None
+
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        created_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
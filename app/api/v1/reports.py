@@ -3,14 +3,15 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 
-from app.api.v1.dependencies import (
-    get_report_service,
-    get_current_user_id,
-)
-from app.services.report_service import ReportService
+from app.api.v1.deps_types import CurrentUserId, ReportServiceDep
+from app.api.v1.etag import make_etag, not_modified
+from app.api.v1.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from app.services.exceptions import (
+    InvalidParametersError,
     ReportNotFoundError,
     SimulationNotFoundError,
     SimulationNotCompletedError,
@@ -20,6 +21,12 @@ from app.models.report import ReportStatus
 
 router = APIRouter()
 
+# Serializes a whole page in one pass instead of per-item encoding
+_REPORTS_ADAPTER = TypeAdapter(list[ReportResponse])
+
+# Stored URLs may have expired; only GET /reports/{id} re-signs them
+_LIST_OMITTED_FIELDS = frozenset({"download_url", "url_expires_at"})
+
 
 @router.post(
     "",
@@ -38,14 +45,14 @@ router = APIRouter()
     status and retrieve the download URL.
     """,
 )
-def create_report(
+async def create_report(
     data: ReportCreate,
-    user_id: UUID = Depends(get_current_user_id),
-    report_service: ReportService = Depends(get_report_service),
+    user_id: CurrentUserId,
+    report_service: ReportServiceDep,
 ) -> ReportResponse:
     """Request report generation."""
     try:
-        report = report_service.create_report(user_id, data)
+        report = await run_in_threadpool(report_service.create_report, user_id, data)
         return ReportResponse.model_validate(report)
         
     except SimulationNotFoundError as e:
@@ -58,6 +65,11 @@ def create_report(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Simulation job {e.job_id} is not completed",
         )
+    except InvalidParametersError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.message,
+        )
 
 
 @router.get(
@@ -75,32 +87,39 @@ def create_report(
     If the report is still generating, only status information is returned.
     """,
 )
-def get_report(
+async def get_report(
     report_id: UUID,
-    user_id: UUID = Depends(get_current_user_id),
-    report_service: ReportService = Depends(get_report_service),
-) -> ReportResponse:
+    request: Request,
+    response: Response,
+    user_id: CurrentUserId,
+    report_service: ReportServiceDep,
+):
     """Get report status and download URL."""
     try:
-        report_data = report_service.get_report_with_url(user_id, report_id)
-        
-        # Map the dict to ReportResponse
-        return ReportResponse(
-            id=UUID(report_data["report_id"]),
-            user_id=UUID(report_data["user_id"]),
-            report_type=report_data["report_type"],
-            output_format=report_data["output_format"],
-            status=ReportStatus(report_data["status"]),
-            simulation_job_ids=[UUID(sid) for sid in report_data["simulation_job_ids"]],
-            created_at=report_data["created_at"],
-            completed_at=report_data.get("completed_at"),
-            download_url=report_data.get("download_url"),
-            url_expires_at=report_data.get("url_expires_at"),
-            content_type=report_data.get("content_type"),
-            size_bytes=report_data.get("size_bytes"),
-            error=report_data.get("error"),
+        report, download_url, url_expires_at = await run_in_threadpool(
+            report_service.get_report_with_url, user_id, report_id
         )
         
+        # Re-signing the URL bumps updated_at, so a fresh URL never 304s
+        etag = make_etag(report.status, report.updated_at)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+        response.headers["ETag"] = etag
+        
+        report_response = ReportResponse.model_validate(report)
+        report_response.download_url = download_url
+        report_response.url_expires_at = url_expires_at
+        
+        # Add error info if failed
+        if report.status == ReportStatus.FAILED:
+            report_response.error = {
+                "code": report.error_code or "UNKNOWN",
+                "message": report.error_message or "Unknown error"
+            }
+        
+        return report_response
+        
     except ReportNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -112,9 +131,16 @@ def get_report(
     "",
     response_model=list[ReportResponse],
     summary="List reports",
-    description="List all reports for the current user with optional filtering.",
+    description="""
+    List all reports for the current user with optional filtering, newest first.
+    
+    When more results are available the response carries an
+    `X-Next-Cursor` header; pass its value as `cursor` to fetch the next page.
+    """,
 )
-def list_reports(
+async def list_reports(
+    user_id: CurrentUserId,
+    report_service: ReportServiceDep,
     status: Optional[ReportStatus] = Query(
         default=None,
         description="Filter by report status"
@@ -124,16 +150,36 @@ def list_reports(
         description="Filter by report type"
     ),
     limit: int = Query(default=100, ge=1, le=1000, description="Maximum results"),
-    offset: int = Query(default=0, ge=0, description="Pagination offset"),
-    user_id: UUID = Depends(get_current_user_id),
-    report_service: ReportService = Depends(get_report_service),
-) -> list[ReportResponse]:
+    offset: int = Query(
+        default=0,
+        ge=0,
+        deprecated=True,
+        description="Pagination offset (use cursor instead)",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor from a previous page's X-Next-Cursor header",
+    ),
+) -> Response:
     """List reports."""
-    reports = report_service.list_reports(
+    reports, next_cursor = await run_in_threadpool(
+        report_service.list_reports,
         user_id=user_id,
         status=status,
         report_type=report_type,
         limit=limit,
         offset=offset,
+        cursor=decode_cursor(cursor),
+    )
+    # Rows come straight from the database, so skip re-validation
+    items = [
+        ReportResponse.construct_from_orm(report, exclude=_LIST_OMITTED_FIELDS)
+        for report in reports
+    ]
+    response = Response(
+        content=_REPORTS_ADAPTER.dump_json(items, by_alias=True),
+        media_type="application/json",
     )
-    return [ReportResponse.model_validate(report) for report in reports]
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_cursor)
+    return response
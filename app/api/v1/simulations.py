@@ -3,14 +3,18 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
 
-from app.api.v1.dependencies import (
-    get_simulation_service,
-    get_current_user_id,
+from app.api.v1.deps_types import CurrentUserId, SimulationServiceDep
+from app.api.v1.etag import make_etag, not_modified
+from app.api.v1.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.services.exceptions import (
+    InvalidParametersError,
+    ResultNotFoundError,
+    SimulationNotFoundError,
 )
-from app.services.simulation_service import SimulationService
-from app.services.exceptions import SimulationNotFoundError, ResultNotFoundError
 from app.schemas.simulation import (
     SimulationCreate,
     SimulationResponse,
@@ -21,6 +25,9 @@ from app.models.simulation import SimulationStatus
 
 router = APIRouter()
 
+# Serializes a whole page in one pass instead of per-item encoding
+_SIMULATIONS_ADAPTER = TypeAdapter(list[SimulationStatusResponse])
+
 
 @router.post(
     "",
@@ -37,13 +44,19 @@ router = APIRouter()
     status and retrieve results.
     """,
 )
-def create_simulation(
+async def create_simulation(
     data: SimulationCreate,
-    user_id: UUID = Depends(get_current_user_id),
-    simulation_service: SimulationService = Depends(get_simulation_service),
+    user_id: CurrentUserId,
+    simulation_service: SimulationServiceDep,
 ) -> SimulationResponse:
     """Submit a new simulation job."""
-    job = simulation_service.create_job(user_id, data)
+    try:
+        job = await run_in_threadpool(simulation_service.create_job, user_id, data)
+    except InvalidParametersError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=e.message,
+        )
     return SimulationResponse.model_validate(job)
 
 
@@ -61,25 +74,34 @@ def create_simulation(
     - Error information if failed
     """,
 )
-def get_simulation_status(
+async def get_simulation_status(
     job_id: UUID,
-    user_id: UUID = Depends(get_current_user_id),
-    simulation_service: SimulationService = Depends(get_simulation_service),
-) -> SimulationStatusResponse:
+    request: Request,
+    response: Response,
+    user_id: CurrentUserId,
+    simulation_service: SimulationServiceDep,
+):
     """Get simulation job status and metadata."""
     try:
-        job = simulation_service.get_job(user_id, job_id)
+        job = await run_in_threadpool(simulation_service.get_job, user_id, job_id)
+        
+        # Pollers send back the last ETag; skip the body if nothing changed
+        etag = make_etag(job.status, job.updated_at)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+        response.headers["ETag"] = etag
         
-        response = SimulationStatusResponse.model_validate(job)
+        job_response = SimulationStatusResponse.model_validate(job)
         
         # Add error info if failed
         if job.status == SimulationStatus.FAILED and (job.error_code or job.error_message):
-            response.error = {
+            job_response.error = {
                 "code": job.error_code or "UNKNOWN",
                 "message": job.error_message or "Unknown error"
             }
         
-        return response
+        return job_response
         
     except SimulationNotFoundError:
         raise HTTPException(
@@ -101,15 +123,25 @@ def get_simulation_status(
     If completed, returns the full result payload.
     """,
 )
-def get_simulation_result(
+async def get_simulation_result(
     job_id: UUID,
-    user_id: UUID = Depends(get_current_user_id),
-    simulation_service: SimulationService = Depends(get_simulation_service),
-) -> SimulationResultResponse:
+    user_id: CurrentUserId,
+    simulation_service: SimulationServiceDep,
+) -> Response:
     """Get simulation result."""
     try:
-        result = simulation_service.get_job_result(user_id, job_id)
-        return SimulationResultResponse(**result)
+        result = await run_in_threadpool(
+            simulation_service.get_job_result_json, user_id, job_id
+        )
+        result_json = result.pop("result_json", None)
+        envelope = SimulationResultResponse(**result).model_dump_json(
+            by_alias=True, exclude={"result"} if result_json is not None else None
+        ).encode()
+        if result_json is not None:
+            # Splice the stored payload in as-is rather than parsing it
+            # only to encode it again
+            envelope = envelope[:-1] + b',"result":' + result_json + b"}"
+        return Response(content=envelope, media_type="application/json")
         
     except SimulationNotFoundError:
         raise HTTPException(
@@ -127,9 +159,16 @@ def get_simulation_result(
     "",
     response_model=list[SimulationStatusResponse],
     summary="List simulation jobs",
-    description="List all simulation jobs for the current user with optional filtering.",
+    description="""
+    List all simulation jobs for the current user with optional filtering, newest first.
+    
+    When more results are available the response carries an
+    `X-Next-Cursor` header; pass its value as `cursor` to fetch the next page.
+    """,
 )
-def list_simulations(
+async def list_simulations(
+    user_id: CurrentUserId,
+    simulation_service: SimulationServiceDep,
     status: Optional[SimulationStatus] = Query(
         default=None,
         description="Filter by job status"
@@ -138,20 +177,43 @@ def list_simulations(
         default=None,
         description="Filter by simulation type"
     ),
+    tag: Optional[str] = Query(
+        default=None,
+        max_length=64,
+        description='Filter by the "tag" key of job_metadata'
+    ),
     limit: int = Query(default=100, ge=1, le=1000, description="Maximum results"),
-    offset: int = Query(default=0, ge=0, description="Pagination offset"),
-    user_id: UUID = Depends(get_current_user_id),
-    simulation_service: SimulationService = Depends(get_simulation_service),
-) -> list[SimulationStatusResponse]:
+    offset: int = Query(
+        default=0,
+        ge=0,
+        deprecated=True,
+        description="Pagination offset (use cursor instead)",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor from a previous page's X-Next-Cursor header",
+    ),
+) -> Response:
     """List simulation jobs."""
-    jobs = simulation_service.list_jobs(
+    jobs, next_cursor = await run_in_threadpool(
+        simulation_service.list_jobs,
         user_id=user_id,
         status=status,
         simulation_type=simulation_type,
+        tag=tag,
         limit=limit,
         offset=offset,
+        cursor=decode_cursor(cursor),
+    )
+    # Rows come straight from the database, so skip re-validation
+    items = [SimulationStatusResponse.construct_from_orm(job) for job in jobs]
+    response = Response(
+        content=_SIMULATIONS_ADAPTER.dump_json(items, by_alias=True),
+        media_type="application/json",
     )
-    return [SimulationStatusResponse.model_validate(job) for job in jobs]
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_cursor)
+    return response
 
 
 @router.post(
@@ -160,14 +222,14 @@ def list_simulations(
     summary="Cancel a simulation job",
     description="Cancel a pending or running simulation job.",
 )
-def cancel_simulation(
+async def cancel_simulation(
     job_id: UUID,
-    user_id: UUID = Depends(get_current_user_id),
-    simulation_service: SimulationService = Depends(get_simulation_service),
+    user_id: CurrentUserId,
+    simulation_service: SimulationServiceDep,
 ) -> SimulationStatusResponse:
     """Cancel a simulation job."""
     try:
-        job = simulation_service.cancel_job(user_id, job_id)
+        job = await run_in_threadpool(simulation_service.cancel_job, user_id, job_id)
         return SimulationStatusResponse.model_validate(job)
         
     except SimulationNotFoundError:
@@ -0,0 +1,115 @@
+"""Short-lived cache of verified bearer tokens."""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from app.config import settings
+from app.models.user import User
+from app.schemas.user import TokenPayload
+
+
+@dataclass(frozen=True, slots=True)
+class CachedUser:
+    """
+    Detached snapshot of the User a token resolved to.
+
+    Carries the fields endpoints read, so a cache hit needs neither the
+    database nor a live ORM session.
+    """
+
+    id: UUID
+    email: str
+    full_name: Optional[str]
+    is_active: bool
+    is_superuser: bool
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_user(cls, user: User) -> "CachedUser":
+        """Copy the cached fields off a loaded User."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=bool(user.is_active),
+            is_superuser=bool(user.is_superuser),
+            created_at=user.created_at,
+        )
+
+
+class CachedToken(NamedTuple):
+    """Result of a successful token verification and user lookup."""
+
+    payload: TokenPayload
+    user: CachedUser
+    cached_at: float
+
+
+_cache: TTLCache = TTLCache(maxsize=settings.JWT_CACHE_SIZE, ttl=settings.JWT_CACHE_TTL)
+_lock = threading.RLock()
+
+
+def _cache_key(token: str) -> bytes:
+    """Hash the token so raw credentials are never kept in memory."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_cached_token(token: str) -> Optional[CachedToken]:
+    """
+    Look up a previously verified token.
+
+    Args:
+        token: Raw bearer token
+
+    Returns:
+        CachedToken if the token was verified recently and hasn't expired
+    """
+    key = _cache_key(token)
+    with _lock:
+        entry = _cache.get(key)
+
+    if entry is None:
+        return None
+
+    # The cache TTL may outlive the token itself
+    if entry.payload.exp is not None and entry.payload.exp <= time.time():
+        with _lock:
+            _cache.pop(key, None)
+        return None
+
+    return entry
+
+
+def cache_token(token: str, payload: TokenPayload, user: User) -> CachedUser:
+    """
+    Remember a verified token and the user it resolved to.
+
+    Args:
+        token: Raw bearer token
+        payload: Verified token payload
+        user: User the token belongs to
+
+    Returns:
+        The cached user snapshot
+    """
+    entry = CachedToken(
+        payload=payload,
+        user=CachedUser.from_user(user),
+        cached_at=time.time(),
+    )
+    with _lock:
+        _cache[_cache_key(token)] = entry
+    return entry.user
+
+
+def clear_token_cache() -> None:
+    """Drop all cached tokens (useful for testing)."""
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,40 @@
+"""
+Helpers for Alembic revisions.
+
+The API calls Base.metadata.create_all at startup, so a database may
+already contain tables, columns or indexes that a revision is about to
+add. Revisions use these checks to skip objects that are already
+present. In offline (--sql) mode there is no database to inspect, so
+every check reports the object as missing and the full DDL is emitted.
+"""
+
+from alembic import context, op
+from sqlalchemy import inspect
+
+
+def _inspector():
+    if context.is_offline_mode():
+        return None
+    return inspect(op.get_bind())
+
+
+def has_table(table: str) -> bool:
+    """Return True if the table exists."""
+    inspector = _inspector()
+    return inspector is not None and inspector.has_table(table)
+
+
+def has_column(table: str, column: str) -> bool:
+    """Return True if the table exists and has the column."""
+    inspector = _inspector()
+    if inspector is None or not inspector.has_table(table):
+        return False
+    return any(c["name"] == column for c in inspector.get_columns(table))
+
+
+def has_index(table: str, index: str) -> bool:
+    """Return True if the table exists and has the named index."""
+    inspector = _inspector()
+    if inspector is None or not inspector.has_table(table):
+        return False
+    return any(i["name"] == index for i in inspector.get_indexes(table))
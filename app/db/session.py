@@ -2,21 +2,41 @@
 
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.config import settings
+from app.storage.json_codec import dumps_json, loads_json
+
+# Cap runaway queries server-side. pgbouncer in transaction mode rejects
+# startup options, so the timeout can be disabled there.
+_connect_args = {}
+_is_postgres = make_url(settings.DATABASE_URL).get_backend_name() == "postgresql"
+if settings.DB_STATEMENT_TIMEOUT_MS and _is_postgres:
+    _connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
 
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_pre_ping=True,  # Enable connection health checks
+    # Recycle connections instead of pinging on every checkout
+    pool_pre_ping=False,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Reuse the most recently returned connection to keep a warm subset
+    pool_use_lifo=True,
+    connect_args=_connect_args,
+    # JSON/JSONB columns (parameters, job_metadata) go through the same
+    # orjson codec as blob payloads instead of the stdlib json module
+    json_serializer=lambda value: dumps_json(value).decode("utf-8"),
+    json_deserializer=loads_json,
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory. Instances keep their loaded state across
+# commit, so services don't pay a SELECT to read back what they just wrote.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 def get_db() -> Generator[Session, None, None]:
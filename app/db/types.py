@@ -0,0 +1,29 @@
+"""Custom column types."""
+
+import sys
+from enum import Enum
+from typing import Any, Optional
+
+from sqlalchemy import String
+from sqlalchemy.types import TypeDecorator
+
+
+class InternedString(TypeDecorator):
+    """
+    String column whose loaded values are interned.
+
+    For low-cardinality columns such as simulation_type, every row of a
+    list then shares one str object per distinct value instead of
+    allocating a copy each.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_result_value(self, value: Optional[str], dialect: Any) -> Optional[str]:
+        return sys.intern(value) if value else value
+
+
+def enum_values(enum_cls: type[Enum]) -> list[str]:
+    """values_callable for sqlalchemy.Enum: bind and load by member value."""
+    return [member.value for member in enum_cls]
@@ -3,13 +3,25 @@
 from app.handlers.registry import (
     SimulationHandler,
     ReportHandler,
+    SimulationExecutor,
+    ReportGenerator,
+    ParameterValidator,
     SimulationHandlerRegistry,
     ReportHandlerRegistry,
+    get_simulation_handler,
+    get_report_handler,
+    load_handler_modules,
 )
 
 __all__ = [
     "SimulationHandler",
     "ReportHandler",
+    "SimulationExecutor",
+    "ReportGenerator",
+    "ParameterValidator",
     "SimulationHandlerRegistry",
     "ReportHandlerRegistry",
+    "get_simulation_handler",
+    "get_report_handler",
+    "load_handler_modules",
 ]
@@ -5,30 +5,104 @@ This module provides the plugin system for registering custom simulation
 and report handlers. The service is agnostic to specific simulation/report
 types - handlers are registered at startup to provide the actual implementation.
 
+A handler is either a plain callable or an instance of the
+SimulationHandler/ReportHandler base classes. Class-based handlers are
+stored as their bound execute/generate method, so dispatching a job is
+a dict lookup followed by a direct function call either way.
+Registrations replace an immutable snapshot of the table under a lock,
+so workers can read it from any thread without locking.
+
 Example usage:
 
     # Define a custom simulation handler
+    def run_monte_carlo_job(job_id, simulation_type, parameters, progress_callback=None):
+        # Run Monte Carlo simulation
+        result = run_monte_carlo(parameters)
+        return result
+
+    # Register the handler, optionally with a parameter validator
+    SimulationHandlerRegistry.register(
+        "monte_carlo", execute=run_monte_carlo_job, validate=validate_mc
+    )
+
+    # Class-based handlers are registered as instances
     class MonteCarloHandler(SimulationHandler):
         def execute(self, job_id, simulation_type, parameters, progress_callback):
-            # Run Monte Carlo simulation
-            result = run_monte_carlo(parameters)
-            return result
-    
-    # Register the handler
+            return run_monte_carlo(parameters)
+
     SimulationHandlerRegistry.register("monte_carlo", MonteCarloHandler())
 """
 
+import importlib
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Iterable, Mapping, Optional, Protocol, Union
 
 logger = logging.getLogger(__name__)
 
+# Report file content: bytes, a readable binary stream, or byte chunks
+ReportContent = Union[bytes, BinaryIO, Iterable[bytes]]
+
+
+class SimulationExecutor(Protocol):
+    """
+    Callable that executes a specific simulation type.
+
+    Args:
+        job_id: Unique job identifier
+        simulation_type: Type of simulation
+        parameters: Simulation parameters
+        progress_callback: Optional callback to report progress (0.0 to 1.0)
+
+    Returns:
+        Simulation result as a dictionary
+    """
+
+    def __call__(
+        self,
+        job_id: str,
+        simulation_type: str,
+        parameters: dict[str, Any],
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> dict[str, Any]:
+        ...
+
+
+class ReportGenerator(Protocol):
+    """
+    Callable that generates a specific report type.
+
+    Args:
+        report_id: Unique report identifier
+        report_type: Type of report
+        output_format: Desired output format (PDF, HTML, JSON, etc.)
+        parameters: Report generation parameters
+        simulation_results: List of simulation results to include
+
+    Returns:
+        Tuple of (file_content, content_type, filename). file_content may
+        be bytes, a readable binary stream or an iterable of byte chunks
+        (e.g. a generator); streams and chunks are uploaded without being
+        read into memory first.
+    """
+
+    def __call__(
+        self,
+        report_id: str,
+        report_type: str,
+        output_format: str,
+        parameters: dict[str, Any],
+        simulation_results: list[dict[str, Any]],
+    ) -> tuple[ReportContent, str, str]:
+        ...
+
 
 class SimulationHandler(ABC):
     """
     Abstract base class for simulation handlers.
-    
+
     Implement this class to add support for a specific simulation type.
     """
 
@@ -42,13 +116,13 @@ class SimulationHandler(ABC):
     ) -> dict[str, Any]:
         """
         Execute the simulation.
-        
+
         Args:
             job_id: Unique job identifier
             simulation_type: Type of simulation
             parameters: Simulation parameters
             progress_callback: Optional callback to report progress (0.0 to 1.0)
-            
+
         Returns:
             Simulation result as a dictionary
         """
@@ -57,12 +131,12 @@ class SimulationHandler(ABC):
     def validate_parameters(self, parameters: dict[str, Any]) -> bool:
         """
         Validate simulation parameters.
-        
+
         Override this method to add parameter validation.
-        
+
         Args:
             parameters: Parameters to validate
-            
+
         Returns:
             True if valid, False otherwise
         """
@@ -72,7 +146,7 @@ class SimulationHandler(ABC):
 class ReportHandler(ABC):
     """
     Abstract base class for report handlers.
-    
+
     Implement this class to add support for a specific report type.
     """
 
@@ -84,17 +158,17 @@ class ReportHandler(ABC):
         output_format: str,
         parameters: dict[str, Any],
         simulation_results: list[dict[str, Any]],
-    ) -> tuple[bytes, str, str]:
+    ) -> tuple[ReportContent, str, str]:
         """
         Generate the report.
-        
+
         Args:
             report_id: Unique report identifier
             report_type: Type of report
             output_format: Desired output format (PDF, HTML, JSON, etc.)
             parameters: Report generation parameters
             simulation_results: List of simulation results to include
-            
+
         Returns:
             Tuple of (file_content, content_type, filename)
         """
@@ -103,139 +177,294 @@ class ReportHandler(ABC):
     def validate_parameters(self, parameters: dict[str, Any]) -> bool:
         """
         Validate report parameters.
-        
+
         Override this method to add parameter validation.
-        
+
         Args:
             parameters: Parameters to validate
-            
+
         Returns:
             True if valid, False otherwise
         """
         return True
 
 
+# Validates handler parameters, returning True if they are acceptable
+ParameterValidator = Callable[[dict[str, Any]], bool]
+
+
+def _accept_all(parameters: dict[str, Any]) -> bool:
+    """Default validator that accepts any parameters."""
+    return True
+
+
+def _resolve(
+    handler: Any, method: str, validate: Optional[ParameterValidator]
+) -> tuple[Callable[..., Any], ParameterValidator, Any]:
+    """
+    Turn a registered handler into a (callable, validator, handler) entry.
+
+    Objects with the base-class method (execute/generate) are stored as
+    that bound method, and their validate_parameters is used unless a
+    validator is passed explicitly.
+    """
+    if handler is None:
+        raise TypeError("A handler is required")
+
+    bound = getattr(handler, method, None)
+    if bound is not None:
+        validate = validate or getattr(handler, "validate_parameters", None)
+        return bound, validate or _accept_all, handler
+
+    return handler, validate or _accept_all, handler
+
+
+# Read-only snapshots of the registries. Writers build a new dict and
+# rebind the name under _registry_lock; readers never need the lock.
+_simulation_handlers: Mapping[str, tuple[SimulationExecutor, ParameterValidator, Any]] = MappingProxyType({})
+_report_handlers: Mapping[str, tuple[ReportGenerator, ParameterValidator, Any]] = MappingProxyType({})
+_registry_lock = threading.Lock()
+
+
+def get_simulation_handler(simulation_type: str) -> Optional[SimulationExecutor]:
+    """
+    Get the handler for a simulation type.
+
+    Args:
+        simulation_type: Type identifier
+
+    Returns:
+        Execute callable or None if not registered
+    """
+    entry = _simulation_handlers.get(simulation_type)
+    return entry[0] if entry else None
+
+
+def get_report_handler(report_type: str) -> Optional[ReportGenerator]:
+    """
+    Get the handler for a report type.
+
+    Args:
+        report_type: Type identifier
+
+    Returns:
+        Generate callable or None if not registered
+    """
+    entry = _report_handlers.get(report_type)
+    return entry[0] if entry else None
+
+
+def load_handler_modules(module_names: str) -> None:
+    """
+    Import the modules that register handlers.
+
+    Called once at process start so handler imports (and whatever they
+    pull in) are paid before the first request or task rather than
+    during it.
+
+    Args:
+        module_names: Comma-separated dotted module paths
+    """
+    for name in filter(None, (n.strip() for n in module_names.split(","))):
+        importlib.import_module(name)
+        logger.info(f"Loaded handler module: {name}")
+
+
 class SimulationHandlerRegistry:
     """
     Registry for simulation handlers.
-    
+
     Handlers are registered by simulation type and retrieved when
     processing simulation jobs.
     """
 
-    _handlers: dict[str, SimulationHandler] = {}
-
     @classmethod
-    def register(cls, simulation_type: str, handler: SimulationHandler) -> None:
+    def register(
+        cls,
+        simulation_type: str,
+        handler: Union[SimulationHandler, SimulationExecutor, None] = None,
+        validate: Optional[ParameterValidator] = None,
+        *,
+        execute: Optional[SimulationExecutor] = None,
+    ) -> None:
         """
         Register a handler for a simulation type.
-        
+
         Args:
             simulation_type: Type identifier (e.g., "monte_carlo")
-            handler: SimulationHandler instance
+            handler: SimulationHandler instance or execute callable
+            validate: Optional callable that validates parameters;
+                defaults to a SimulationHandler's validate_parameters
+            execute: Execute callable, as a keyword alternative to handler
         """
-        cls._handlers[simulation_type] = handler
+        global _simulation_handlers
+        entry = _resolve(handler or execute, "execute", validate)
+        with _registry_lock:
+            handlers = dict(_simulation_handlers)
+            handlers[simulation_type] = entry
+            _simulation_handlers = MappingProxyType(handlers)
         logger.info(f"Registered simulation handler for type: {simulation_type}")
 
     @classmethod
     def unregister(cls, simulation_type: str) -> None:
         """
         Unregister a handler.
-        
+
         Args:
             simulation_type: Type identifier to unregister
         """
-        if simulation_type in cls._handlers:
-            del cls._handlers[simulation_type]
-            logger.info(f"Unregistered simulation handler for type: {simulation_type}")
+        global _simulation_handlers
+        with _registry_lock:
+            if simulation_type not in _simulation_handlers:
+                return
+            handlers = dict(_simulation_handlers)
+            del handlers[simulation_type]
+            _simulation_handlers = MappingProxyType(handlers)
+        logger.info(f"Unregistered simulation handler for type: {simulation_type}")
 
     @classmethod
-    def get_handler(cls, simulation_type: str) -> Optional[SimulationHandler]:
+    def get_handler(
+        cls, simulation_type: str
+    ) -> Union[SimulationHandler, SimulationExecutor, None]:
         """
         Get the handler for a simulation type.
-        
+
+        Args:
+            simulation_type: Type identifier
+
+        Returns:
+            The handler as registered (instance or callable), or None if
+            not registered
+        """
+        entry = _simulation_handlers.get(simulation_type)
+        return entry[2] if entry else None
+
+    @classmethod
+    def get_validator(cls, simulation_type: str) -> Optional[ParameterValidator]:
+        """
+        Get the parameter validator for a simulation type.
+
         Args:
             simulation_type: Type identifier
-            
+
         Returns:
-            SimulationHandler instance or None if not registered
+            Validate callable or None if not registered
         """
-        return cls._handlers.get(simulation_type)
+        entry = _simulation_handlers.get(simulation_type)
+        return entry[1] if entry else None
 
     @classmethod
     def list_handlers(cls) -> list[str]:
         """
         List all registered simulation types.
-        
+
         Returns:
             List of registered simulation type identifiers
         """
-        return list(cls._handlers.keys())
+        return list(_simulation_handlers.keys())
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered handlers (useful for testing)."""
-        cls._handlers.clear()
+        global _simulation_handlers
+        with _registry_lock:
+            _simulation_handlers = MappingProxyType({})
 
 
 class ReportHandlerRegistry:
     """
     Registry for report handlers.
-    
+
     Handlers are registered by report type and retrieved when
     generating reports.
     """
 
-    _handlers: dict[str, ReportHandler] = {}
-
     @classmethod
-    def register(cls, report_type: str, handler: ReportHandler) -> None:
+    def register(
+        cls,
+        report_type: str,
+        handler: Union[ReportHandler, ReportGenerator, None] = None,
+        validate: Optional[ParameterValidator] = None,
+        *,
+        generate: Optional[ReportGenerator] = None,
+    ) -> None:
         """
         Register a handler for a report type.
-        
+
         Args:
             report_type: Type identifier (e.g., "summary")
-            handler: ReportHandler instance
+            handler: ReportHandler instance or generate callable
+            validate: Optional callable that validates parameters;
+                defaults to a ReportHandler's validate_parameters
+            generate: Generate callable, as a keyword alternative to handler
         """
-        cls._handlers[report_type] = handler
+        global _report_handlers
+        entry = _resolve(handler or generate, "generate", validate)
+        with _registry_lock:
+            handlers = dict(_report_handlers)
+            handlers[report_type] = entry
+            _report_handlers = MappingProxyType(handlers)
         logger.info(f"Registered report handler for type: {report_type}")
 
     @classmethod
     def unregister(cls, report_type: str) -> None:
         """
         Unregister a handler.
-        
+
         Args:
             report_type: Type identifier to unregister
         """
-        if report_type in cls._handlers:
-            del cls._handlers[report_type]
-            logger.info(f"Unregistered report handler for type: {report_type}")
+        global _report_handlers
+        with _registry_lock:
+            if report_type not in _report_handlers:
+                return
+            handlers = dict(_report_handlers)
+            del handlers[report_type]
+            _report_handlers = MappingProxyType(handlers)
+        logger.info(f"Unregistered report handler for type: {report_type}")
 
     @classmethod
-    def get_handler(cls, report_type: str) -> Optional[ReportHandler]:
+    def get_handler(cls, report_type: str) -> Union[ReportHandler, ReportGenerator, None]:
         """
         Get the handler for a report type.
-        
+
         Args:
             report_type: Type identifier
-            
+
         Returns:
-            ReportHandler instance or None if not registered
+            The handler as registered (instance or callable), or None if
+            not registered
         """
-        return cls._handlers.get(report_type)
+        entry = _report_handlers.get(report_type)
+        return entry[2] if entry else None
+
+    @classmethod
+    def get_validator(cls, report_type: str) -> Optional[ParameterValidator]:
+        """
+        Get the parameter validator for a report type.
+
+        Args:
+            report_type: Type identifier
+
+        Returns:
+            Validate callable or None if not registered
+        """
+        entry = _report_handlers.get(report_type)
+        return entry[1] if entry else None
 
     @classmethod
     def list_handlers(cls) -> list[str]:
         """
         List all registered report types.
-        
+
         Returns:
             List of registered report type identifiers
         """
-        return list(cls._handlers.keys())
+        return list(_report_handlers.keys())
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered handlers (useful for testing)."""
-        cls._handlers.clear()
+        global _report_handlers
+        with _registry_lock:
+            _report_handlers = MappingProxyType({})
@@ -2,13 +2,18 @@
 
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.v1.pagination import NEXT_CURSOR_HEADER
 from app.api.v1.router import api_router
 from app.config import settings
 from app.db.session import engine
 from app.db.base import Base
+from app.handlers.registry import load_handler_modules
+from app.storage.blob_storage import S3Storage
+from app.storage.result_cache import ResultCache
 
 
 @asynccontextmanager
@@ -16,6 +21,15 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown events."""
     # Startup: Create database tables
     Base.metadata.create_all(bind=engine)
+    # Register handlers so their parameter validators run on submission
+    load_handler_modules(settings.HANDLER_MODULES)
+    # Build the S3 client once; it is shared by every request
+    app.state.blob_storage = S3Storage()
+    app.state.result_cache = ResultCache() if settings.RESULT_CACHE_TTL > 0 else None
+    # Service calls run in the threadpool; size it to the DB pool so
+    # requests wait on a thread rather than on a pooled connection
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
     yield
     # Shutdown: cleanup if needed
     pass
@@ -40,6 +54,7 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", NEXT_CURSOR_HEADER],
     )
 
     # Include API router
@@ -2,6 +2,6 @@
 
 from app.models.user import User
 from app.models.simulation import SimulationJob
-from app.models.report import Report
+from app.models.report import Report, ReportSimulation
 
-__all__ = ["User", "SimulationJob", "Report"]
+__all__ = ["User", "SimulationJob", "Report", "ReportSimulation"]
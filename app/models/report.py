@@ -4,12 +4,15 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, String, DateTime, BigInteger, Text, Enum, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
+from uuid import UUID as PyUUID
+
+from sqlalchemy import Column, String, DateTime, BigInteger, Integer, Text, Enum, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
+from app.db.types import InternedString, enum_values
 
 
 class ReportStatus(str, PyEnum):
@@ -32,25 +35,22 @@ class Report(Base):
     __tablename__ = "reports"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
     # Report type - opaque to the service
-    report_type = Column(String(255), nullable=False, index=True)
+    report_type = Column(InternedString(255), nullable=False, index=True)
     
     # Output format
-    output_format = Column(String(50), nullable=False)  # PDF, HTML, JSON, etc.
+    output_format = Column(InternedString(50), nullable=False)  # PDF, HTML, JSON, etc.
     
     # Status
     status = Column(
-        Enum(ReportStatus, name="report_status"),
+        Enum(ReportStatus, name="report_status", values_callable=enum_values),
         nullable=False,
         default=ReportStatus.PENDING,
         index=True
     )
     
-    # Source simulation job IDs
-    simulation_job_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=False)
-    
     # Report generation parameters
     parameters = Column(JSONB, nullable=False, default=dict)
     
@@ -59,6 +59,10 @@ class Report(Base):
     content_type = Column(String(100), nullable=True)
     size_bytes = Column(BigInteger, nullable=True)
     
+    # Pre-signed download URL, signed when the report completes
+    download_url = Column(String(2048), nullable=True)
+    url_expires_at = Column(DateTime(timezone=True), nullable=True)
+    
     # Error information
     error_code = Column(String(100), nullable=True)
     error_message = Column(Text, nullable=True)
@@ -67,9 +71,80 @@ class Report(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     expires_at = Column(DateTime(timezone=True), nullable=True)  # For auto-cleanup
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    # Listing filters by owner (and optionally status) and pages newest
+    # first by (created_at, id), so both sit in one index range scan
+    __table_args__ = (
+        Index("ix_reports_user_created", user_id, created_at.desc(), id.desc()),
+        Index(
+            "ix_reports_user_status_created",
+            user_id,
+            status,
+            created_at.desc(),
+            id.desc(),
+        ),
+        # Containment (@>) lookups on parameters only; see SimulationJob
+        Index(
+            "ix_reports_parameters_gin",
+            parameters,
+            postgresql_using="gin",
+            postgresql_ops={"parameters": "jsonb_path_ops"},
+        ),
+    )
+
+    # Fetch server-generated created_at/updated_at with RETURNING on
+    # INSERT and UPDATE rather than reloading the row afterwards
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
-    user = relationship("User", backref="reports")
+    user = relationship("User", back_populates="reports")
+    # Source simulation jobs, fetched with one extra SELECT ... IN query
+    simulations = relationship(
+        "ReportSimulation",
+        order_by="ReportSimulation.position",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+
+    @property
+    def simulation_job_ids(self) -> list[PyUUID]:
+        """Source simulation job IDs, in the order they were requested."""
+        return [link.simulation_job_id for link in self.simulations]
 
     def __repr__(self) -> str:
         return f"<Report(id={self.id}, type={self.report_type}, status={self.status})>"
+
+
+class ReportSimulation(Base):
+    """
+    Link between a report and one of its source simulation jobs.
+    
+    Replaces an array column on reports so that lookups by simulation
+    job are plain btree index hits.
+    """
+
+    __tablename__ = "report_simulations"
+
+    report_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("reports.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    simulation_job_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("simulation_jobs.id"),
+        primary_key=True,
+        index=True,
+    )
+    
+    # Order of the simulation within the report
+    position = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ReportSimulation(report_id={self.report_id}, simulation_job_id={self.simulation_job_id})>"
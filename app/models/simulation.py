@@ -4,12 +4,13 @@ import uuid
 from datetime import datetime
 from enum import Enum as PyEnum
 
-from sqlalchemy import Column, String, DateTime, Numeric, BigInteger, Text, Enum, ForeignKey
+from sqlalchemy import Column, String, DateTime, Numeric, BigInteger, Text, Enum, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
+from app.db.types import InternedString, enum_values
 
 
 class SimulationStatus(str, PyEnum):
@@ -33,19 +34,20 @@ class SimulationJob(Base):
     __tablename__ = "simulation_jobs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
     # Simulation type - opaque to the service
-    simulation_type = Column(String(255), nullable=False, index=True)
+    simulation_type = Column(InternedString(255), nullable=False, index=True)
     
     # Job status
     status = Column(
-        Enum(SimulationStatus, name="simulation_status"),
+        Enum(SimulationStatus, name="simulation_status", values_callable=enum_values),
         nullable=False,
         default=SimulationStatus.PENDING,
         index=True
     )
-    progress = Column(Numeric(5, 4), nullable=True)  # 0.0000 to 1.0000
+    # asdecimal=False returns floats, avoiding a Decimal per loaded row
+    progress = Column(Numeric(5, 4, asdecimal=False), nullable=True)  # 0.0000 to 1.0000
     
     # Parameters - stored in DB if small, or reference to S3
     parameters = Column(JSONB, nullable=False, default=dict)
@@ -61,6 +63,9 @@ class SimulationJob(Base):
     
     # User-defined metadata (named job_metadata to avoid SQLAlchemy reserved name)
     job_metadata = Column(JSONB, nullable=False, default=dict)
+    # Copy of job_metadata["tag"] so tag filters hit a plain index;
+    # job_metadata stays the source of truth
+    tag = Column(String(64), nullable=True)
     
     # Callback URL for completion notification
     callback_url = Column(String(2048), nullable=True)
@@ -69,9 +74,47 @@ class SimulationJob(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    # Listing filters by owner (and optionally status or tag) and pages
+    # newest first by (created_at, id), so both sit in one index range scan
+    __table_args__ = (
+        Index("ix_simulation_jobs_user_created", user_id, created_at.desc(), id.desc()),
+        Index(
+            "ix_simulation_jobs_user_status_created",
+            user_id,
+            status,
+            created_at.desc(),
+            id.desc(),
+        ),
+        Index(
+            "ix_simulation_jobs_user_tag_created",
+            user_id,
+            tag,
+            created_at.desc(),
+            id.desc(),
+        ),
+        # jsonb_path_ops only serves containment (parameters @> '{...}');
+        # key-existence (?) and equality filters still scan
+        Index(
+            "ix_simulation_jobs_parameters_gin",
+            parameters,
+            postgresql_using="gin",
+            postgresql_ops={"parameters": "jsonb_path_ops"},
+        ),
+    )
+
+    # Fetch server-generated created_at/updated_at with RETURNING on
+    # INSERT and UPDATE rather than reloading the row afterwards
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relationships
-    user = relationship("User", backref="simulation_jobs")
+    user = relationship("User", back_populates="simulation_jobs")
 
     def __repr__(self) -> str:
         return f"<SimulationJob(id={self.id}, type={self.simulation_type}, status={self.status})>"
@@ -6,6 +6,7 @@ from datetime import datetime
 from sqlalchemy import Column, String, DateTime, Boolean
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
 
 from app.db.base import Base
 
@@ -28,5 +29,13 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    # Fetch server-generated created_at/updated_at with RETURNING on
+    # INSERT and UPDATE rather than reloading the row afterwards
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Relationships
+    simulation_jobs = relationship("SimulationJob", back_populates="user")
+    reports = relationship("Report", back_populates="user")
+
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email})>"
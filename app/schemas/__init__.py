@@ -12,6 +12,7 @@ from app.schemas.report import (
 )
 from app.schemas.user import (
     UserCreate,
+    LoginRequest,
     UserResponse,
     Token,
     TokenPayload,
@@ -25,6 +26,7 @@ __all__ = [
     "ReportCreate",
     "ReportResponse",
     "UserCreate",
+    "LoginRequest",
     "UserResponse",
     "Token",
     "TokenPayload",
@@ -0,0 +1,40 @@
+"""Shared base classes for Pydantic schemas."""
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ORMResponseModel(BaseModel):
+    """
+    Base class for response schemas built from ORM objects.
+
+    Rows loaded from the database already carry validated types, so
+    list endpoints can copy attributes across without re-validating.
+    """
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+    @classmethod
+    def construct_from_orm(cls, obj: Any, exclude: frozenset[str] = frozenset()):
+        """
+        Build an instance from a trusted ORM object without validation.
+
+        Attributes are looked up by alias (the ORM column name) and
+        missing or excluded attributes fall back to the field default.
+
+        Args:
+            obj: SQLAlchemy model instance
+            exclude: Field names to leave at their default
+
+        Returns:
+            Unvalidated schema instance
+        """
+        values = {}
+        for name, field in cls.model_fields.items():
+            if name in exclude:
+                continue
+            key = field.alias or name
+            if hasattr(obj, key):
+                values[key] = getattr(obj, key)
+        return cls.model_construct(**values)
@@ -4,9 +4,10 @@ from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from app.models.report import ReportStatus
+from app.schemas.base import ORMResponseModel
 
 
 class ReportCreate(BaseModel):
@@ -41,11 +42,9 @@ class ReportCreate(BaseModel):
         return v.upper()
 
 
-class ReportResponse(BaseModel):
+class ReportResponse(ORMResponseModel):
     """Schema for report response."""
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
-
     report_id: UUID = Field(..., alias="id", description="Unique report identifier")
     user_id: UUID = Field(..., description="Owner user ID")
     report_type: str = Field(..., description="Type of report")
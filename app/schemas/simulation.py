@@ -7,6 +7,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field, ConfigDict
 
 from app.models.simulation import SimulationStatus
+from app.schemas.base import ORMResponseModel
 
 
 class SimulationCreate(BaseModel):
@@ -45,11 +46,9 @@ class SimulationResponse(BaseModel):
     created_at: datetime = Field(..., description="Job creation timestamp")
 
 
-class SimulationStatusResponse(BaseModel):
+class SimulationStatusResponse(ORMResponseModel):
     """Schema for simulation job status response."""
 
-    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
-
     job_id: UUID = Field(..., alias="id", description="Unique job identifier")
     user_id: UUID = Field(..., description="Owner user ID")
     simulation_type: str = Field(..., description="Type of simulation")
@@ -15,6 +15,13 @@ class UserCreate(BaseModel):
     full_name: Optional[str] = Field(default=None, description="User's full name")
 
 
+class LoginRequest(BaseModel):
+    """Schema for JSON login requests."""
+
+    email: str = Field(..., description="User email address")
+    password: str = Field(..., description="User password")
+
+
 class UserResponse(BaseModel):
     """Schema for user response."""
 
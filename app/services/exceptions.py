@@ -53,6 +53,18 @@ class ResultNotFoundError(ServiceError):
         )
 
 
+class InvalidParametersError(ServiceError):
+    """Parameters rejected by the registered handler's validator."""
+
+    def __init__(self, kind: str, handler_type: str):
+        self.kind = kind
+        self.handler_type = handler_type
+        super().__init__(
+            message=f"Invalid parameters for {kind} type {handler_type}",
+            code="INVALID_PARAMETERS"
+        )
+
+
 class ReportNotFoundError(NotFoundError):
     """Report not found error."""
 
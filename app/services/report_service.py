@@ -1,19 +1,22 @@
 """Report service for managing report generation."""
 
 import logging
-from datetime import datetime, timedelta
-from io import BytesIO
-from typing import Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.orm import Session, load_only, raiseload
 
 from app.config import settings
-from app.models.report import Report, ReportStatus
+from app.handlers.registry import ReportHandlerRegistry
+from app.models.report import Report, ReportSimulation, ReportStatus
 from app.models.simulation import SimulationJob, SimulationStatus
 from app.schemas.report import ReportCreate
 from app.storage.blob_storage import BlobStorage, S3Storage
+from app.workers.celery_app import GENERATE_REPORT_TASK, celery_app
 from app.services.exceptions import (
+    InvalidParametersError,
     ReportNotFoundError,
     SimulationNotFoundError,
     SimulationNotCompletedError,
@@ -21,6 +24,33 @@ from app.services.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Columns needed to render a ReportResponse. Leaves out the JSONB
+# parameters, which only the worker reads.
+_REPORT_VIEW_COLUMNS = (
+    Report.id,
+    Report.user_id,
+    Report.report_type,
+    Report.output_format,
+    Report.status,
+    Report.s3_key,
+    Report.content_type,
+    Report.size_bytes,
+    Report.download_url,
+    Report.url_expires_at,
+    Report.error_code,
+    Report.error_message,
+    Report.created_at,
+    Report.completed_at,
+    Report.updated_at,
+)
+
+# The list view omits download URLs; they are only re-signed and served
+# by get_report_with_url
+_REPORT_LIST_COLUMNS = tuple(
+    column for column in _REPORT_VIEW_COLUMNS
+    if column.key not in ("download_url", "url_expires_at")
+)
+
 
 class ReportService:
     """
@@ -56,32 +86,45 @@ class ReportService:
         Raises:
             SimulationNotFoundError: If a referenced simulation doesn't exist
             SimulationNotCompletedError: If a referenced simulation isn't completed
+            InvalidParametersError: If the registered handler rejects the parameters
         """
-        # Verify all simulation jobs exist and are completed
+        validate = ReportHandlerRegistry.get_validator(data.report_type)
+        if validate and not validate(data.parameters or {}):
+            raise InvalidParametersError("report", data.report_type)
+        
+        # Verify all simulation jobs exist and are completed in one query
+        rows = self.db.execute(
+            select(SimulationJob.id, SimulationJob.status).where(
+                SimulationJob.id.in_(data.simulation_job_ids),
+                SimulationJob.user_id == user_id,
+            )
+        ).all()
+        found = {row.id: row.status for row in rows}
+        
         for sim_id in data.simulation_job_ids:
-            job = self.db.query(SimulationJob).filter(
-                SimulationJob.id == sim_id,
-                SimulationJob.user_id == user_id
-            ).first()
-            
-            if not job:
+            if sim_id not in found:
                 raise SimulationNotFoundError(sim_id)
             
-            if job.status != SimulationStatus.COMPLETED:
+            if found[sim_id] != SimulationStatus.COMPLETED:
                 raise SimulationNotCompletedError(sim_id)
         
+        # Links are inserted in one batch after the report row; created_at
+        # and updated_at come back from INSERT ... RETURNING (eager_defaults)
+        sim_ids = list(dict.fromkeys(data.simulation_job_ids))
         report = Report(
             user_id=user_id,
             report_type=data.report_type,
             output_format=data.output_format,
-            simulation_job_ids=data.simulation_job_ids,
             parameters=data.parameters or {},
             status=ReportStatus.PENDING,
+            simulations=[
+                ReportSimulation(simulation_job_id=sim_id, position=position)
+                for position, sim_id in enumerate(sim_ids)
+            ],
         )
         
         self.db.add(report)
         self.db.commit()
-        self.db.refresh(report)
         
         # Enqueue for async generation
         self._enqueue_report(report.id)
@@ -103,12 +146,11 @@ class ReportService:
         Raises:
             ReportNotFoundError: If report doesn't exist or user doesn't own it
         """
-        report = self.db.query(Report).filter(
-            Report.id == report_id,
-            Report.user_id == user_id
-        ).first()
+        # Primary-key lookup hits the identity map first; check ownership
+        # in Python and report a mismatch as not found
+        report = self.db.get(Report, report_id)
         
-        if not report:
+        if not report or report.user_id != user_id:
             raise ReportNotFoundError(report_id)
         
         return report
@@ -128,14 +170,43 @@ class ReportService:
         Raises:
             ReportNotFoundError: If report doesn't exist
         """
-        report = self.db.query(Report).filter(Report.id == report_id).first()
+        report = self.db.get(Report, report_id)
+        
+        if not report:
+            raise ReportNotFoundError(report_id)
+        
+        return report
+
+    def _get_report_projected(
+        self, user_id: UUID, report_id: UUID, columns: tuple
+    ) -> Report:
+        """
+        Get a report loading only the given columns (with ownership verification).
+        
+        Args:
+            user_id: Requesting user ID
+            report_id: Report ID
+            columns: Report column attributes to load
+            
+        Returns:
+            Report instance with the remaining columns deferred
+            
+        Raises:
+            ReportNotFoundError: If report doesn't exist or user doesn't own it
+        """
+        report = self.db.query(Report).options(load_only(*columns)).filter(
+            Report.id == report_id,
+            Report.user_id == user_id
+        ).first()
         
         if not report:
             raise ReportNotFoundError(report_id)
         
         return report
 
-    def get_report_with_url(self, user_id: UUID, report_id: UUID) -> dict[str, Any]:
+    def get_report_with_url(
+        self, user_id: UUID, report_id: UUID
+    ) -> tuple[Report, Optional[str], Optional[datetime]]:
         """
         Get report with download URL if ready.
         
@@ -144,41 +215,26 @@ class ReportService:
             report_id: Report ID
             
         Returns:
-            Report data with optional download URL
+            Tuple of (report, download_url, url_expires_at). The URL fields
+            are None unless the report is completed.
         """
-        report = self.get_report(user_id, report_id)
-        
-        response = {
-            "report_id": str(report.id),
-            "user_id": str(report.user_id),
-            "status": report.status.value,
-            "report_type": report.report_type,
-            "output_format": report.output_format,
-            "simulation_job_ids": [str(sid) for sid in report.simulation_job_ids],
-            "created_at": report.created_at.isoformat(),
-        }
+        report = self._get_report_projected(user_id, report_id, _REPORT_VIEW_COLUMNS)
+        
+        download_url = None
+        url_expires_at = None
         
         if report.status == ReportStatus.COMPLETED and report.s3_key:
-            # Generate pre-signed URL
-            expires_in = settings.PRESIGNED_URL_EXPIRY
-            response["download_url"] = self.blob_storage.generate_presigned_url(
-                report.s3_key,
-                expires_in=expires_in
-            )
-            response["url_expires_at"] = (
-                datetime.utcnow() + timedelta(seconds=expires_in)
-            ).isoformat()
-            response["content_type"] = report.content_type
-            response["size_bytes"] = report.size_bytes
-            response["completed_at"] = report.completed_at.isoformat() if report.completed_at else None
-        
-        if report.status == ReportStatus.FAILED:
-            response["error"] = {
-                "code": report.error_code,
-                "message": report.error_message
-            }
-        
-        return response
+            # Reuse the URL signed at completion until it nears expiry
+            if self._presigned_url_is_fresh(report):
+                download_url = report.download_url
+                url_expires_at = report.url_expires_at
+            else:
+                download_url, url_expires_at = self._presign(report.s3_key)
+                report.download_url = download_url
+                report.url_expires_at = url_expires_at
+                self.db.commit()
+        
+        return report, download_url, url_expires_at
 
     def list_reports(
         self,
@@ -187,21 +243,33 @@ class ReportService:
         report_type: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[Report]:
+        cursor: Optional[tuple[datetime, UUID]] = None,
+    ) -> tuple[list[Report], Optional[tuple[datetime, UUID]]]:
         """
-        List reports for a user.
+        List reports for a user, newest first.
+        
+        Pages are addressed by a keyset cursor: the (created_at, id) of
+        the last row of the previous page. Offset is still accepted for
+        older clients but costs a scan of every skipped row.
         
         Args:
             user_id: Owner user ID
             status: Optional status filter
             report_type: Optional report type filter
             limit: Maximum number of results
-            offset: Pagination offset
+            offset: Pagination offset (deprecated, ignored with a cursor)
+            cursor: Sort key of the last row already seen
             
         Returns:
-            List of Report instances
+            Tuple of (reports, next_cursor). next_cursor is None on the
+            last page.
         """
-        query = self.db.query(Report).filter(Report.user_id == user_id)
+        # List responses never include the owner; fail loudly rather
+        # than lazy-load it once per row
+        query = self.db.query(Report).options(
+            load_only(*_REPORT_LIST_COLUMNS),
+            raiseload(Report.user),
+        ).filter(Report.user_id == user_id)
         
         if status:
             query = query.filter(Report.status == status)
@@ -209,7 +277,23 @@ class ReportService:
         if report_type:
             query = query.filter(Report.report_type == report_type)
         
-        return query.order_by(Report.created_at.desc()).offset(offset).limit(limit).all()
+        if cursor:
+            query = query.filter(tuple_(Report.created_at, Report.id) < cursor)
+        elif offset:
+            query = query.offset(offset)
+        
+        # Fetch one extra row to tell whether another page exists
+        reports = query.order_by(
+            Report.created_at.desc(), Report.id.desc()
+        ).limit(limit + 1).all()
+        
+        next_cursor = None
+        if len(reports) > limit:
+            reports = reports[:limit]
+            last = reports[-1]
+            next_cursor = (last.created_at, last.id)
+        
+        return reports, next_cursor
 
     def update_report_status(
         self,
@@ -230,20 +314,25 @@ class ReportService:
         Returns:
             Updated Report instance
         """
-        report = self.get_report_by_id(report_id)
-        
-        report.status = status
+        values = {"status": status}
         
         if status in (ReportStatus.COMPLETED, ReportStatus.FAILED):
-            report.completed_at = datetime.utcnow()
+            values["completed_at"] = func.now()
         
         if error_code:
-            report.error_code = error_code
+            values["error_code"] = error_code
         if error_message:
-            report.error_message = error_message
+            values["error_message"] = error_message
+        
+        # One UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        report = self.db.execute(
+            update(Report).where(Report.id == report_id).values(**values).returning(Report)
+        ).scalar_one_or_none()
+        
+        if not report:
+            raise ReportNotFoundError(report_id)
         
         self.db.commit()
-        self.db.refresh(report)
         
         logger.info(f"Updated report {report_id} status to {status.value}")
         return report
@@ -251,43 +340,93 @@ class ReportService:
     def save_report_file(
         self,
         report_id: UUID,
-        file_content: bytes,
+        file_stream: BinaryIO,
         content_type: str,
         filename: str,
+        size_hint: Optional[int] = None,
     ) -> Report:
         """
-        Save generated report file to S3.
+        Stream a generated report file to S3.
         
         Args:
             report_id: Report ID
-            file_content: Report file content
+            file_stream: Readable binary stream with the report content
             content_type: MIME type of the file
             filename: Filename for storage
+            size_hint: Content length if known; otherwise taken from the
+                stream (seekable) or from S3 after the upload
             
         Returns:
             Updated Report instance
         """
+        # Usually an identity-map hit in the worker, so no transaction is
+        # open (and no pooled connection held) during the upload
         report = self.get_report_by_id(report_id)
         
         s3_key = S3Storage.build_report_key(
             str(report.user_id), str(report_id), filename
         )
         
-        file_obj = BytesIO(file_content)
-        self.blob_storage.upload_file(s3_key, file_obj, content_type)
-        
-        report.s3_key = s3_key
-        report.content_type = content_type
-        report.size_bytes = len(file_content)
-        report.status = ReportStatus.COMPLETED
-        report.completed_at = datetime.utcnow()
+        size_bytes = size_hint if size_hint is not None else _remaining_size(file_stream)
+        self.blob_storage.upload_file(s3_key, file_stream, content_type)
+        if size_bytes is None:
+            size_bytes = self.blob_storage.get_object_size(s3_key)
+        
+        # Sign the download URL once here rather than on every GET
+        download_url, url_expires_at = self._presign(s3_key)
+        
+        report = self.db.execute(
+            update(Report)
+            .where(Report.id == report_id)
+            .values(
+                s3_key=s3_key,
+                content_type=content_type,
+                size_bytes=size_bytes,
+                download_url=download_url,
+                url_expires_at=url_expires_at,
+                status=ReportStatus.COMPLETED,
+                completed_at=func.now(),
+            )
+            .returning(Report)
+        ).scalar_one()
         
         self.db.commit()
-        self.db.refresh(report)
         
         logger.info(f"Saved report file for {report_id} to {s3_key}")
         return report
 
+    def _presign(self, s3_key: str) -> tuple[str, datetime]:
+        """
+        Generate a pre-signed download URL and its expiry time.
+        
+        Args:
+            s3_key: Storage key of the report file
+            
+        Returns:
+            Tuple of (download_url, url_expires_at)
+        """
+        expires_in = settings.PRESIGNED_URL_EXPIRY
+        download_url = self.blob_storage.generate_presigned_url(
+            s3_key,
+            expires_in=expires_in
+        )
+        url_expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        return download_url, url_expires_at
+
+    @staticmethod
+    def _presigned_url_is_fresh(report: Report) -> bool:
+        """Check whether the stored download URL is still safely valid."""
+        if not report.download_url or not report.url_expires_at:
+            return False
+        
+        expires_at = report.url_expires_at
+        if expires_at.tzinfo is None:
+            # Some backends (e.g. SQLite) return naive UTC datetimes
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        
+        remaining = expires_at - datetime.now(timezone.utc)
+        return remaining.total_seconds() > settings.PRESIGNED_URL_REFRESH_MARGIN
+
     def _enqueue_report(self, report_id: UUID) -> None:
         """
         Enqueue report for async generation.
@@ -295,7 +434,22 @@ class ReportService:
         Args:
             report_id: Report ID to enqueue
         """
-        # Import here to avoid circular imports
-        from app.workers.tasks import generate_report
-        generate_report.delay(str(report_id))
+        # Published by name so the task module isn't imported here;
+        # task_routes picks the queue, and the report ID doubles as task ID
+        celery_app.send_task(
+            GENERATE_REPORT_TASK, args=(str(report_id),), task_id=str(report_id)
+        )
         logger.info(f"Enqueued report {report_id} for generation")
+
+
+def _remaining_size(stream: BinaryIO) -> Optional[int]:
+    """Bytes left in a seekable stream, or None if it can't seek."""
+    try:
+        if not stream.seekable():
+            return None
+        start = stream.tell()
+        end = stream.seek(0, 2)
+        stream.seek(start)
+        return end - start
+    except (AttributeError, OSError):
+        return None
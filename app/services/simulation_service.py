@@ -1,18 +1,24 @@
 """Simulation service for managing simulation jobs."""
 
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, tuple_, update
+from sqlalchemy.orm import Session, raiseload
 
 from app.config import settings
+from app.handlers.registry import SimulationHandlerRegistry
 from app.models.simulation import SimulationJob, SimulationStatus
 from app.schemas.simulation import SimulationCreate
 from app.storage.blob_storage import BlobStorage, S3Storage
+from app.storage.json_codec import dumps_json, loads_json
+from app.storage.result_cache import ResultCache
+from app.workers.celery_app import PROCESS_SIMULATION_TASK, celery_app
 from app.services.exceptions import (
+    InvalidParametersError,
     SimulationNotFoundError,
     SimulationNotCompletedError,
     ResultNotFoundError,
@@ -20,6 +26,11 @@ from app.services.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_TAG_MAX_LENGTH = SimulationJob.__table__.c.tag.type.length
+
+# Keeps IN (...) lists well under driver parameter limits
+_IN_BATCH_SIZE = 1000
+
 
 class SimulationService:
     """
@@ -30,16 +41,23 @@ class SimulationService:
     by registered handlers or external services.
     """
 
-    def __init__(self, db: Session, blob_storage: BlobStorage):
+    def __init__(
+        self,
+        db: Session,
+        blob_storage: BlobStorage,
+        result_cache: Optional[ResultCache] = None,
+    ):
         """
         Initialize the simulation service.
         
         Args:
             db: SQLAlchemy database session
             blob_storage: Blob storage client for S3/compatible storage
+            result_cache: Optional cache for completed result payloads
         """
         self.db = db
         self.blob_storage = blob_storage
+        self.result_cache = result_cache
 
     def create_job(self, user_id: UUID, data: SimulationCreate) -> SimulationJob:
         """
@@ -51,29 +69,37 @@ class SimulationService:
             
         Returns:
             Created SimulationJob instance
+            
+        Raises:
+            InvalidParametersError: If the registered handler rejects the parameters
         """
+        validate = SimulationHandlerRegistry.get_validator(data.simulation_type)
+        if validate and not validate(data.parameters):
+            raise InvalidParametersError("simulation", data.simulation_type)
+        
+        # The ID is generated here rather than by a flush, so the blob
+        # upload happens before any row is written and the job is a
+        # single INSERT ... RETURNING at commit
         job = SimulationJob(
+            id=uuid4(),
             user_id=user_id,
             simulation_type=data.simulation_type,
             job_metadata=data.job_metadata or {},
+            tag=_promoted_tag(data.job_metadata),
             callback_url=data.callback_url,
             status=SimulationStatus.PENDING,
         )
         
-        # First add and flush to get the job ID
-        self.db.add(job)
-        self.db.flush()
-        
-        # Decide where to store parameters based on size
-        params_json = json.dumps(data.parameters, default=str)
-        params_size = len(params_json.encode("utf-8"))
+        # Decide where to store parameters based on size; the encoded
+        # bytes are uploaded as-is rather than serialized a second time
+        params_bytes = dumps_json(data.parameters)
         
-        if params_size > settings.PARAMETERS_SIZE_THRESHOLD:
+        if len(params_bytes) > settings.PARAMETERS_SIZE_THRESHOLD:
             # Store large parameters in S3
             s3_key = S3Storage.build_simulation_key(
                 str(user_id), str(job.id), "parameters.json"
             )
-            self.blob_storage.upload_json(s3_key, data.parameters)
+            self.blob_storage.upload_json_bytes(s3_key, params_bytes)
             job.parameters = {"_s3_reference": True}
             job.parameters_s3_key = s3_key
             logger.info(f"Stored large parameters in S3: {s3_key}")
@@ -81,8 +107,8 @@ class SimulationService:
             # Store small parameters in PostgreSQL
             job.parameters = data.parameters
         
+        self.db.add(job)
         self.db.commit()
-        self.db.refresh(job)
         
         # Enqueue job for async processing
         self._enqueue_job(job.id)
@@ -104,12 +130,11 @@ class SimulationService:
         Raises:
             SimulationNotFoundError: If job doesn't exist or user doesn't own it
         """
-        job = self.db.query(SimulationJob).filter(
-            SimulationJob.id == job_id,
-            SimulationJob.user_id == user_id
-        ).first()
+        # Primary-key lookup hits the identity map first; check ownership
+        # in Python and report a mismatch as not found
+        job = self.db.get(SimulationJob, job_id)
         
-        if not job:
+        if not job or job.user_id != user_id:
             raise SimulationNotFoundError(job_id)
         
         return job
@@ -129,9 +154,7 @@ class SimulationService:
         Raises:
             SimulationNotFoundError: If job doesn't exist
         """
-        job = self.db.query(SimulationJob).filter(
-            SimulationJob.id == job_id
-        ).first()
+        job = self.db.get(SimulationJob, job_id)
         
         if not job:
             raise SimulationNotFoundError(job_id)
@@ -143,25 +166,35 @@ class SimulationService:
         user_id: UUID,
         status: Optional[SimulationStatus] = None,
         simulation_type: Optional[str] = None,
+        tag: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[SimulationJob]:
+        cursor: Optional[tuple[datetime, UUID]] = None,
+    ) -> tuple[list[SimulationJob], Optional[tuple[datetime, UUID]]]:
         """
-        List simulation jobs for a user.
+        List simulation jobs for a user, newest first.
+        
+        Pages are addressed by a keyset cursor, as in
+        ReportService.list_reports.
         
         Args:
             user_id: Owner user ID
             status: Optional status filter
             simulation_type: Optional simulation type filter
+            tag: Optional job_metadata["tag"] filter
             limit: Maximum number of results
-            offset: Pagination offset
+            offset: Pagination offset (deprecated, ignored with a cursor)
+            cursor: Sort key of the last row already seen
             
         Returns:
-            List of SimulationJob instances
+            Tuple of (jobs, next_cursor). next_cursor is None on the
+            last page.
         """
-        query = self.db.query(SimulationJob).filter(
-            SimulationJob.user_id == user_id
-        )
+        # List responses never include the owner; fail loudly rather
+        # than lazy-load it once per row
+        query = self.db.query(SimulationJob).options(
+            raiseload(SimulationJob.user)
+        ).filter(SimulationJob.user_id == user_id)
         
         if status:
             query = query.filter(SimulationJob.status == status)
@@ -169,7 +202,26 @@ class SimulationService:
         if simulation_type:
             query = query.filter(SimulationJob.simulation_type == simulation_type)
         
-        return query.order_by(SimulationJob.created_at.desc()).offset(offset).limit(limit).all()
+        if tag:
+            query = query.filter(SimulationJob.tag == tag)
+        
+        if cursor:
+            query = query.filter(tuple_(SimulationJob.created_at, SimulationJob.id) < cursor)
+        elif offset:
+            query = query.offset(offset)
+        
+        # Fetch one extra row to tell whether another page exists
+        jobs = query.order_by(
+            SimulationJob.created_at.desc(), SimulationJob.id.desc()
+        ).limit(limit + 1).all()
+        
+        next_cursor = None
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            last = jobs[-1]
+            next_cursor = (last.created_at, last.id)
+        
+        return jobs, next_cursor
 
     def get_job_parameters(self, job: SimulationJob) -> dict[str, Any]:
         """
@@ -189,6 +241,33 @@ class SimulationService:
         """
         Get simulation result.
         
+        Args:
+            user_id: Requesting user ID
+            job_id: Simulation job ID
+            
+        Returns:
+            Result data dictionary with string job_id, status and
+            completed_at, as passed to report handlers
+            
+        Raises:
+            SimulationNotFoundError: If job doesn't exist or user doesn't own it
+        """
+        job = self.get_job(user_id, job_id)
+        
+        if job.status != SimulationStatus.COMPLETED:
+            return self._handler_result(job)
+        
+        return self._handler_result(job, self._read_result_json(job))
+
+    def get_job_result_json(self, user_id: UUID, job_id: UUID) -> dict[str, Any]:
+        """
+        Get simulation result with the payload left as stored JSON.
+        
+        Used by the result endpoint. A completed job's payload is returned
+        unparsed under "result_json" so it can be written to a response
+        without a decode/encode round trip, and job_id, status and
+        completed_at are native values for the response schema.
+        
         Args:
             user_id: Requesting user ID
             job_id: Simulation job ID
@@ -201,6 +280,89 @@ class SimulationService:
         """
         job = self.get_job(user_id, job_id)
         
+        if job.status != SimulationStatus.COMPLETED:
+            return self._result_envelope(job)
+        
+        return self._result_envelope(job, self._read_result_json(job))
+
+    def get_job_results_bulk(
+        self, user_id: UUID, job_ids: list[UUID]
+    ) -> list[dict[str, Any]]:
+        """
+        Get results for several jobs at once.
+        
+        Jobs are loaded with one query per batch of IDs and the stored
+        payloads are downloaded in parallel, so gathering N results
+        costs about one round trip instead of N.
+        
+        Args:
+            user_id: Requesting user ID
+            job_ids: Simulation job IDs
+            
+        Returns:
+            Result data dictionaries, as from get_job_result, in the
+            order of job_ids
+            
+        Raises:
+            SimulationNotFoundError: If any job doesn't exist or user doesn't own it
+        """
+        jobs: dict[UUID, SimulationJob] = {}
+        for start in range(0, len(job_ids), _IN_BATCH_SIZE):
+            batch = job_ids[start:start + _IN_BATCH_SIZE]
+            jobs.update(
+                (job.id, job)
+                for job in self.db.query(SimulationJob).filter(
+                    SimulationJob.user_id == user_id, SimulationJob.id.in_(batch)
+                )
+            )
+        
+        for job_id in job_ids:
+            if job_id not in jobs:
+                raise SimulationNotFoundError(job_id)
+        
+        completed = [
+            job for job in jobs.values() if job.status == SimulationStatus.COMPLETED
+        ]
+        payloads: dict[UUID, bytes] = {}
+        if completed:
+            # boto3 clients are thread-safe; only storage calls run in the
+            # pool, the session stays on this thread
+            workers = min(len(completed), settings.RESULT_FETCH_CONCURRENCY)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                payloads = dict(zip(
+                    (job.id for job in completed),
+                    pool.map(self._read_result_json, completed),
+                ))
+        
+        return [self._handler_result(jobs[job_id], payloads.get(job_id)) for job_id in job_ids]
+
+    def _read_result_json(self, job: SimulationJob) -> bytes:
+        """
+        Read a completed job's stored result, via the cache if enabled.
+        
+        Raises:
+            ResultNotFoundError: If the job has no stored result
+        """
+        if not job.result_s3_key:
+            raise ResultNotFoundError(job.id)
+        
+        result_json = self.result_cache.get(job.id) if self.result_cache else None
+        if result_json is None:
+            result_json = self.blob_storage.download_json_bytes(job.result_s3_key)
+            if self.result_cache:
+                self.result_cache.set(job.id, result_json)
+        return result_json
+
+    @staticmethod
+    def _handler_result(
+        job: SimulationJob, result_json: Optional[bytes] = None
+    ) -> dict[str, Any]:
+        """
+        Build the result dictionary handed to report handlers.
+        
+        Handlers are free to stdlib-json.dumps or string-compare these,
+        so every field other than the parsed result is a plain string.
+        """
         if job.status != SimulationStatus.COMPLETED:
             return {
                 "job_id": str(job.id),
@@ -208,16 +370,32 @@ class SimulationService:
                 "message": f"Simulation is {job.status.value.lower()}"
             }
         
-        if not job.result_s3_key:
-            raise ResultNotFoundError(job_id)
-        
-        result_data = self.blob_storage.download_json(job.result_s3_key)
-        
         return {
             "job_id": str(job.id),
-            "status": "COMPLETED",
-            "result": result_data,
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None
+            "status": job.status.value,
+            "result": loads_json(result_json),
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        }
+
+    @staticmethod
+    def _result_envelope(
+        job: SimulationJob, result_json: Optional[bytes] = None
+    ) -> dict[str, Any]:
+        """Build the result endpoint's dictionary for a job and its stored payload."""
+        if job.status != SimulationStatus.COMPLETED:
+            return {
+                "job_id": job.id,
+                "status": job.status,
+                "message": f"Simulation is {job.status.value.lower()}"
+            }
+        
+        # Pass native UUID/enum/datetime values so the response schema
+        # doesn't have to parse them back out of strings
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "result_json": result_json,
+            "completed_at": job.completed_at,
         }
 
     def update_job_status(
@@ -241,26 +419,27 @@ class SimulationService:
         Returns:
             Updated SimulationJob instance
         """
-        job = self.get_job_by_id(job_id)
-        
-        job.status = status
+        values: dict[str, Any] = {"status": status}
         
         if progress is not None:
-            job.progress = progress
+            values["progress"] = progress
         
-        if status == SimulationStatus.RUNNING and not job.started_at:
-            job.started_at = datetime.utcnow()
+        if status == SimulationStatus.RUNNING:
+            # Keep the first start time if the job was already running
+            values["started_at"] = func.coalesce(SimulationJob.started_at, func.now())
         
         if status in (SimulationStatus.COMPLETED, SimulationStatus.FAILED, SimulationStatus.CANCELLED):
-            job.completed_at = datetime.utcnow()
+            values["completed_at"] = func.now()
         
         if error_code:
-            job.error_code = error_code
+            values["error_code"] = error_code
         if error_message:
-            job.error_message = error_message
+            values["error_message"] = error_message
         
-        self.db.commit()
-        self.db.refresh(job)
+        job = self._update_job(job_id, **values)
+        
+        if status == SimulationStatus.FAILED:
+            self._forget_result(job_id)
         
         logger.info(f"Updated job {job_id} status to {status.value}")
         return job
@@ -281,16 +460,20 @@ class SimulationService:
         s3_key = S3Storage.build_simulation_key(
             str(job.user_id), str(job_id), "result.json"
         )
-        self.blob_storage.upload_json(s3_key, result)
-        
-        job.result_s3_key = s3_key
-        job.result_size_bytes = self.blob_storage.get_object_size(s3_key)
-        job.status = SimulationStatus.COMPLETED
-        job.completed_at = datetime.utcnow()
-        job.progress = 1.0
-        
-        self.db.commit()
-        self.db.refresh(job)
+        # Encode locally so the size is known without a HEAD request
+        result_bytes = dumps_json(result)
+        self.blob_storage.upload_json_bytes(s3_key, result_bytes)
+        
+        job = self._update_job(
+            job_id,
+            result_s3_key=s3_key,
+            result_size_bytes=len(result_bytes),
+            status=SimulationStatus.COMPLETED,
+            completed_at=func.now(),
+            progress=1.0,
+        )
+        # A retried job overwrites the stored result
+        self._forget_result(job_id)
         
         logger.info(f"Saved result for job {job_id} to {s3_key}")
         return job
@@ -311,15 +494,49 @@ class SimulationService:
         if job.status not in (SimulationStatus.PENDING, SimulationStatus.RUNNING):
             raise ValueError(f"Cannot cancel job with status {job.status.value}")
         
-        job.status = SimulationStatus.CANCELLED
-        job.completed_at = datetime.utcnow()
-        
-        self.db.commit()
-        self.db.refresh(job)
+        job = self._update_job(
+            job_id, status=SimulationStatus.CANCELLED, completed_at=func.now()
+        )
+        self._forget_result(job_id)
         
         logger.info(f"Cancelled job {job_id}")
         return job
 
+    def _forget_result(self, job_id: UUID) -> None:
+        """Drop any cached result payload for a job."""
+        if self.result_cache:
+            self.result_cache.delete(job_id)
+
+    def _update_job(self, job_id: UUID, **values: Any) -> SimulationJob:
+        """
+        Write columns with one UPDATE ... RETURNING and commit.
+        
+        Database-side values such as now() come back with the statement,
+        so nothing is re-read after the commit.
+        
+        Args:
+            job_id: Simulation job ID
+            **values: Column values to set
+            
+        Returns:
+            Updated SimulationJob instance
+            
+        Raises:
+            SimulationNotFoundError: If job doesn't exist
+        """
+        job = self.db.execute(
+            update(SimulationJob)
+            .where(SimulationJob.id == job_id)
+            .values(**values)
+            .returning(SimulationJob)
+        ).scalar_one_or_none()
+        
+        if not job:
+            raise SimulationNotFoundError(job_id)
+        
+        self.db.commit()
+        return job
+
     def _enqueue_job(self, job_id: UUID) -> None:
         """
         Enqueue job for async processing.
@@ -327,7 +544,22 @@ class SimulationService:
         Args:
             job_id: Simulation job ID to enqueue
         """
-        # Import here to avoid circular imports
-        from app.workers.tasks import process_simulation
-        process_simulation.delay(str(job_id))
+        # Published by name so the task module isn't imported here;
+        # task_routes picks the queue, and the job ID doubles as task ID
+        celery_app.send_task(
+            PROCESS_SIMULATION_TASK, args=(str(job_id),), task_id=str(job_id)
+        )
         logger.info(f"Enqueued job {job_id} for processing")
+
+
+def _promoted_tag(job_metadata: Optional[dict[str, Any]]) -> Optional[str]:
+    """
+    Return the job_metadata "tag" value to store in the tag column.
+
+    Only strings that fit the column are promoted. Longer values could
+    never equal a filter value, which is capped at the same length.
+    """
+    tag = (job_metadata or {}).get("tag")
+    if isinstance(tag, str) and len(tag) <= _TAG_MAX_LENGTH:
+        return tag
+    return None
@@ -1,7 +1,7 @@
 """User service for authentication and user management."""
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
@@ -22,6 +22,54 @@ logger = logging.getLogger(__name__)
 # JWT settings
 ALGORITHM = "HS256"
 
+# Settings are frozen, so the HMAC key is encoded once rather than on
+# every sign/verify
+_SIGNING_KEY: bytes = settings.SECRET_KEY.encode("utf-8")
+
+# Decoder arguments are built once and shared by every verification
+_JWT_DECODE_KWARGS = {
+    "algorithms": (ALGORITHM,),
+    "options": {"require_exp": True, "require_sub": True},
+}
+
+
+# Checked against when the email is unknown, so a login costs one bcrypt
+# verification whether or not the account exists
+_DUMMY_PASSWORD_HASH: bytes = bcrypt.hashpw(
+    b"dummy-password", bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+)
+
+
+class TokenVerifier:
+    """
+    Stateless JWT verifier.
+    
+    Holds no per-request state, so a single instance is shared by
+    every request instead of being rebuilt alongside a UserService.
+    """
+
+    def verify(self, token: str) -> TokenPayload:
+        """
+        Verify a JWT token and extract payload.
+        
+        Args:
+            token: JWT token string
+            
+        Returns:
+            TokenPayload with user ID
+            
+        Raises:
+            AuthenticationError: If token is invalid
+        """
+        try:
+            payload = jwt.decode(token, _SIGNING_KEY, **_JWT_DECODE_KWARGS)
+            return TokenPayload(sub=payload.get("sub"), exp=payload.get("exp"))
+        except JWTError as e:
+            raise AuthenticationError(f"Invalid token: {str(e)}")
+
+
+token_verifier = TokenVerifier()
+
 
 class UserService:
     """Service for user management and authentication."""
@@ -55,7 +103,6 @@ class UserService:
         
         self.db.add(user)
         self.db.commit()
-        self.db.refresh(user)
         
         logger.info(f"Created user {user.id} with email {user.email}")
         return user
@@ -73,7 +120,7 @@ class UserService:
         Raises:
             UserNotFoundError: If user doesn't exist
         """
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         
         if not user:
             raise UserNotFoundError(user_id)
@@ -109,6 +156,7 @@ class UserService:
         user = self.get_user_by_email(email)
         
         if not user:
+            bcrypt.checkpw(password.encode("utf-8"), _DUMMY_PASSWORD_HASH)
             raise AuthenticationError("Invalid email or password")
         
         if not self._verify_password(password, user.hashed_password):
@@ -129,14 +177,14 @@ class UserService:
         Returns:
             JWT token string
         """
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         
         payload = {
             "sub": str(user_id),
             "exp": expire,
         }
         
-        return jwt.encode(payload, settings.SECRET_KEY, algorithm=ALGORITHM)
+        return jwt.encode(payload, _SIGNING_KEY, algorithm=ALGORITHM)
 
     def verify_token(self, token: str) -> TokenPayload:
         """
@@ -151,17 +199,13 @@ class UserService:
         Raises:
             AuthenticationError: If token is invalid
         """
-        try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-            return TokenPayload(sub=payload.get("sub"), exp=payload.get("exp"))
-        except JWTError as e:
-            raise AuthenticationError(f"Invalid token: {str(e)}")
+        return token_verifier.verify(token)
 
     def _hash_password(self, password: str) -> str:
         """Hash a password using bcrypt."""
         # Encode to bytes and hash
         password_bytes = password.encode("utf-8")
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode("utf-8")
 
@@ -1,5 +1,6 @@
 """Storage module for blob storage operations."""
 
 from app.storage.blob_storage import BlobStorage, S3Storage
+from app.storage.result_cache import ResultCache
 
-__all__ = ["BlobStorage", "S3Storage"]
+__all__ = ["BlobStorage", "S3Storage", "ResultCache"]
@@ -1,17 +1,47 @@
 """Blob storage abstraction layer for S3 and compatible services."""
 
-import json
+import gzip
 import logging
+import threading
+from io import BytesIO
 from abc import ABC, abstractmethod
 from typing import Any, BinaryIO, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.config import settings
+from app.storage.json_codec import dumps_json, loads_json
 
 logger = logging.getLogger(__name__)
 
+# One session for the process, so endpoint data and the credential chain
+# are resolved once instead of per client. Sessions aren't thread-safe,
+# hence the lock around client creation.
+_session = boto3.session.Session()
+_session_lock = threading.Lock()
+
+# Clients are thread-safe, so one per distinct configuration is shared by
+# every S3Storage; per-task instances in workers then reuse warm pools
+_clients: dict[tuple, Any] = {}
+
+_CLIENT_CONFIG = Config(
+    signature_version="s3v4",
+    max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+    retries={"max_attempts": 2, "mode": "standard"},
+    tcp_keepalive=True,
+)
+
+# Large files are streamed as parallel multipart uploads, so memory use
+# is bounded by chunk size x concurrency whatever the file size
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=settings.S3_MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=settings.S3_MULTIPART_CHUNK_SIZE,
+    max_concurrency=settings.S3_UPLOAD_CONCURRENCY,
+)
+
 
 class BlobStorage(ABC):
     """
@@ -63,6 +93,54 @@ class BlobStorage(ABC):
         """
         pass
 
+    def upload_bytes(self, key: str, data: bytes, content_type: str) -> str:
+        """
+        Upload an already-encoded payload to storage.
+        
+        The default streams it through upload_file; providers can
+        override it with a single-request upload.
+        
+        Args:
+            key: Storage key/path
+            data: Payload bytes
+            content_type: MIME type of the payload
+            
+        Returns:
+            The storage key
+        """
+        return self.upload_file(key, BytesIO(data), content_type)
+
+    def upload_json_bytes(self, key: str, data: bytes) -> str:
+        """
+        Upload JSON that the caller has already encoded.
+        
+        Lets callers that needed the encoded form anyway (e.g. to measure
+        it) skip a second serialization. download_json reads it back.
+        
+        Args:
+            key: Storage key/path
+            data: UTF-8 JSON bytes
+            
+        Returns:
+            The storage key
+        """
+        return self.upload_bytes(key, data, "application/json")
+
+    def download_json_bytes(self, key: str) -> bytes:
+        """
+        Download stored JSON without parsing it.
+        
+        For callers that pass the payload straight through, such as an
+        HTTP response body.
+        
+        Args:
+            key: Storage key/path
+            
+        Returns:
+            UTF-8 JSON bytes
+        """
+        return self.download_file(key)
+
     @abstractmethod
     def download_file(self, key: str) -> bytes:
         """
@@ -168,7 +246,7 @@ class S3Storage(BlobStorage):
                 aws_secret_access_key or settings.AWS_SECRET_ACCESS_KEY
             )
         
-        self.s3_client = boto3.client("s3", **client_kwargs)
+        self.s3_client = self._create_client(client_kwargs)
         
         # Create a separate client for generating public pre-signed URLs
         # This uses the public endpoint URL that's accessible from outside Docker
@@ -176,10 +254,21 @@ class S3Storage(BlobStorage):
         if public_url:
             public_client_kwargs = client_kwargs.copy()
             public_client_kwargs["endpoint_url"] = public_url
-            self.s3_public_client = boto3.client("s3", **public_client_kwargs)
+            self.s3_public_client = self._create_client(public_client_kwargs)
         else:
             self.s3_public_client = self.s3_client
 
+    @staticmethod
+    def _create_client(client_kwargs: dict[str, Any]):
+        """Return the shared S3 client for these settings, creating it once."""
+        cache_key = tuple(sorted(client_kwargs.items()))
+        with _session_lock:
+            client = _clients.get(cache_key)
+            if client is None:
+                client = _session.client("s3", config=_CLIENT_CONFIG, **client_kwargs)
+                _clients[cache_key] = client
+            return client
+
     @staticmethod
     def build_simulation_key(user_id: str, job_id: str, filename: str) -> str:
         """Build S3 key for simulation files."""
@@ -192,37 +281,68 @@ class S3Storage(BlobStorage):
 
     def upload_json(self, key: str, data: dict[str, Any]) -> str:
         """Upload JSON data to S3."""
+        return self.upload_json_bytes(key, dumps_json(data))
+
+    def upload_json_bytes(self, key: str, data: bytes) -> str:
+        """Upload encoded JSON to S3, gzip-compressed."""
+        # Level 1: most of the size reduction on JSON for a fraction of
+        # the CPU of the default level
+        body = gzip.compress(data, compresslevel=1)
+        return self._put(
+            key, body, {"ContentType": "application/json", "ContentEncoding": "gzip"}
+        )
+
+    def upload_bytes(self, key: str, data: bytes, content_type: str) -> str:
+        """Upload an in-memory payload to S3."""
+        return self._put(key, data, {"ContentType": content_type})
+
+    def _put(self, key: str, body: bytes, extra_args: dict[str, str]) -> str:
+        """Single PUT for small bodies, multipart above the threshold."""
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=json.dumps(data, default=str).encode("utf-8"),
-                ContentType="application/json",
-            )
-            logger.info(f"Uploaded JSON to s3://{self.bucket_name}/{key}")
+            if len(body) > _TRANSFER_CONFIG.multipart_threshold:
+                self.s3_client.upload_fileobj(
+                    BytesIO(body),
+                    self.bucket_name,
+                    key,
+                    ExtraArgs=extra_args,
+                    Config=_TRANSFER_CONFIG,
+                )
+            else:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name, Key=key, Body=body, **extra_args
+                )
+            logger.info(f"Uploaded {len(body)} bytes to s3://{self.bucket_name}/{key}")
             return key
         except ClientError as e:
-            logger.error(f"Failed to upload JSON to S3: {e}")
+            logger.error(f"Failed to upload to S3: {e}")
             raise
 
     def download_json(self, key: str) -> dict[str, Any]:
         """Download and parse JSON from S3."""
+        return loads_json(self.download_json_bytes(key))
+
+    def download_json_bytes(self, key: str) -> bytes:
+        """Download JSON from S3, decompressed but not parsed."""
         try:
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            content = response["Body"].read().decode("utf-8")
-            return json.loads(content)
+            content = response["Body"].read()
+            # Objects written before compression was enabled are plain JSON
+            if response.get("ContentEncoding") == "gzip":
+                content = gzip.decompress(content)
+            return content
         except ClientError as e:
             logger.error(f"Failed to download JSON from S3: {e}")
             raise
 
     def upload_file(self, key: str, file_obj: BinaryIO, content_type: str) -> str:
-        """Upload binary file to S3."""
+        """Stream a binary file to S3, using multipart for large files."""
         try:
             self.s3_client.upload_fileobj(
                 file_obj,
                 self.bucket_name,
                 key,
                 ExtraArgs={"ContentType": content_type},
+                Config=_TRANSFER_CONFIG,
             )
             logger.info(f"Uploaded file to s3://{self.bucket_name}/{key}")
             return key
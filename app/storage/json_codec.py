@@ -0,0 +1,52 @@
+"""JSON encoding for payloads kept in blob storage."""
+
+import json
+from typing import Any
+
+import orjson
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> str:
+    """Encode datetimes as ISO 8601, as orjson does, and anything else with str()."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    orjson writes bytes directly; values it rejects (integers wider than
+    64 bits) fall back to the stdlib encoder, which writes datetimes in
+    the same ISO 8601 form.
+
+    Args:
+        data: JSON-compatible value; anything else is encoded with str()
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON
+    """
+    option = _DUMPS_OPTIONS | orjson.OPT_INDENT_2 if indent else _DUMPS_OPTIONS
+    try:
+        return orjson.dumps(data, default=str, option=option)
+    except orjson.JSONEncodeError:
+        return json.dumps(data, default=_default, indent=2 if indent else None).encode("utf-8")
+
+
+def loads_json(content: bytes) -> Any:
+    """
+    Parse JSON bytes without decoding them to str first.
+
+    Note that orjson reads integers wider than 64 bits as floats.
+
+    Args:
+        content: Encoded JSON
+
+    Returns:
+        Parsed value
+    """
+    return orjson.loads(content)
@@ -0,0 +1,93 @@
+"""Redis cache for completed simulation result payloads."""
+
+import logging
+from typing import Optional
+from uuid import UUID
+
+import redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """
+    Short-lived cache of stored result JSON, keyed by job ID.
+
+    The cache only ever holds the serialized payload; ownership and
+    status are still checked against the database on every read. Redis
+    errors are logged and treated as a miss so an unavailable cache
+    falls back to blob storage instead of failing the request.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        ttl: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize the result cache.
+
+        Args:
+            url: Redis URL (defaults to settings.REDIS_URL)
+            ttl: Seconds an entry is kept (defaults to settings.RESULT_CACHE_TTL)
+            max_bytes: Largest payload that is cached
+                (defaults to settings.RESULT_CACHE_MAX_BYTES)
+        """
+        # The client connects lazily, so building it never touches Redis
+        self._client = redis.Redis.from_url(
+            url or settings.REDIS_URL,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+        self.ttl = settings.RESULT_CACHE_TTL if ttl is None else ttl
+        self.max_bytes = settings.RESULT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+
+    @staticmethod
+    def _key(job_id: UUID) -> str:
+        return f"sim:result:{job_id}"
+
+    def get(self, job_id: UUID) -> Optional[bytes]:
+        """
+        Get a cached payload.
+
+        Args:
+            job_id: Simulation job ID
+
+        Returns:
+            Stored JSON bytes, or None on a miss
+        """
+        try:
+            return self._client.get(self._key(job_id))
+        except redis.RedisError as e:
+            logger.warning(f"Result cache read failed for job {job_id}: {e}")
+            return None
+
+    def set(self, job_id: UUID, payload: bytes) -> None:
+        """
+        Cache a payload unless it is larger than max_bytes.
+
+        Args:
+            job_id: Simulation job ID
+            payload: Stored JSON bytes
+        """
+        if len(payload) > self.max_bytes:
+            return
+        try:
+            self._client.set(self._key(job_id), payload, ex=self.ttl)
+        except redis.RedisError as e:
+            logger.warning(f"Result cache write failed for job {job_id}: {e}")
+
+    def delete(self, job_id: UUID) -> None:
+        """
+        Drop a cached payload.
+
+        Args:
+            job_id: Simulation job ID
+        """
+        try:
+            self._client.delete(self._key(job_id))
+        except redis.RedisError as e:
+            logger.warning(f"Result cache delete failed for job {job_id}: {e}")
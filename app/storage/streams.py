@@ -0,0 +1,52 @@
+"""Adapters for uploading generated content without buffering it."""
+
+import io
+from collections.abc import Iterable, Iterator
+from typing import BinaryIO, Union
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read-only raw stream over an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks: Iterator[bytes] = iter(chunks)
+        # The current chunk is read through a view and an offset, so a
+        # large chunk is never copied just to drop what was consumed
+        self._pending = memoryview(b"")
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._offset >= len(self._pending):
+            try:
+                self._pending = memoryview(next(self._chunks)).cast("B")
+            except StopIteration:
+                return 0
+            self._offset = 0
+        size = min(len(buffer), len(self._pending) - self._offset)
+        buffer[:size] = self._pending[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+
+def as_stream(content: Union[bytes, BinaryIO, Iterable[bytes]]) -> BinaryIO:
+    """
+    Return report content as a readable binary stream.
+
+    Bytes are wrapped in BytesIO and streams are passed through; any
+    other iterable is read lazily, one chunk at a time, so a generator
+    can produce a file larger than memory.
+
+    Args:
+        content: Bytes, a readable binary stream, or byte chunks
+
+    Returns:
+        Readable binary stream
+    """
+    if isinstance(content, (bytes, bytearray)):
+        return io.BytesIO(content)
+    if hasattr(content, "read"):
+        return content
+    return io.BufferedReader(_ChunkReader(content), buffer_size=64 * 1024)
@@ -1,8 +1,16 @@
 """Celery application configuration."""
 
+import sys
+
 from celery import Celery
+from celery.signals import worker_init
 
 from app.config import settings
+from app.handlers.registry import load_handler_modules
+
+# Task names, so producers can publish without importing the task module
+PROCESS_SIMULATION_TASK = "app.workers.tasks.process_simulation"
+GENERATE_REPORT_TASK = "app.workers.tasks.generate_report"
 
 # Create Celery app
 celery_app = Celery(
@@ -14,27 +22,60 @@ celery_app = Celery(
 
 # Celery configuration
 celery_app.conf.update(
-    # Task settings
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # Task settings. msgpack is a C codec and produces smaller messages;
+    # json stays accepted so messages queued before a deploy still run.
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_accept_content=["msgpack", "json"],
     timezone="UTC",
     enable_utc=True,
     
     # Task routing
     task_routes={
-        "app.workers.tasks.process_simulation": {"queue": "simulations"},
-        "app.workers.tasks.generate_report": {"queue": "reports"},
+        PROCESS_SIMULATION_TASK: {"queue": "simulations"},
+        GENERATE_REPORT_TASK: {"queue": "reports"},
     },
     
     # Task execution settings
     task_acks_late=True,  # Acknowledge after task completion
     task_reject_on_worker_lost=True,  # Requeue if worker dies
     
-    # Result settings
+    # Result settings. Job and report state lives in the database, so
+    # return values aren't stored; failures still are, for debugging.
+    task_ignore_result=True,
+    task_store_errors_even_if_ignored=True,
     result_expires=3600,  # Results expire after 1 hour
     
+    # Broker connections: keep a warm pool with keepalive so publishing
+    # doesn't reconnect, and detect dead sockets before they're used
+    broker_pool_limit=50,
+    broker_transport_options={
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+    },
+    redis_socket_keepalive=True,
+    redis_backend_health_check_interval=30,
+    
     # Worker settings
-    worker_prefetch_multiplier=1,  # One task at a time per worker
-    worker_concurrency=4,  # Number of concurrent workers
+    # One task at a time per worker process or greenlet. The reports
+    # worker runs on gevent, where its many greenlets already keep
+    # several reserved tasks in flight.
+    worker_prefetch_multiplier=1,
+    worker_concurrency=4,  # Fixed pool size when not started with --autoscale or -c
 )
+
+
+@worker_init.connect
+def _load_handlers(**kwargs) -> None:
+    """Import handler modules in the main worker process, before any fork."""
+    load_handler_modules(settings.HANDLER_MODULES)
+
+
+@worker_init.connect
+def _make_psycopg_cooperative(**kwargs) -> None:
+    """Let psycopg2 yield to other greenlets when the worker runs on -P gevent."""
+    gevent_monkey = sys.modules.get("gevent.monkey")
+    if gevent_monkey and gevent_monkey.is_module_patched("socket"):
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
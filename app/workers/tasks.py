@@ -2,23 +2,60 @@
 
 import logging
 import time
+from typing import Optional
 from uuid import UUID
 
 from celery import shared_task
+from celery.exceptions import Ignore
+from celery.signals import task_postrun, worker_process_init
+from sqlalchemy.orm import scoped_session
 
-from app.workers.celery_app import celery_app
-from app.db.session import SessionLocal
+from app.workers.celery_app import GENERATE_REPORT_TASK, PROCESS_SIMULATION_TASK, celery_app
+from app.db.session import SessionLocal, engine
+from app.config import settings
 from app.storage.blob_storage import S3Storage
+from app.storage.json_codec import dumps_json
+from app.storage.result_cache import ResultCache
+from app.storage.streams import as_stream
 from app.services.simulation_service import SimulationService
 from app.services.report_service import ReportService
 from app.models.simulation import SimulationStatus
 from app.models.report import ReportStatus
-from app.handlers.registry import SimulationHandlerRegistry, ReportHandlerRegistry
+from app.handlers.registry import get_report_handler, get_simulation_handler
 
 logger = logging.getLogger(__name__)
 
+# Shared so saving or failing a job drops the API's cached result
+_result_cache = ResultCache() if settings.RESULT_CACHE_TTL > 0 else None
+
+# Tasks share one session per worker thread, released after each task
+Session = scoped_session(SessionLocal)
+
+_blob_storage: Optional[S3Storage] = None
+
+
+def _get_blob_storage() -> S3Storage:
+    """Return this process's S3 storage, creating it on first use."""
+    global _blob_storage
+    if _blob_storage is None:
+        _blob_storage = S3Storage()
+    return _blob_storage
+
+
+@worker_process_init.connect
+def _reset_after_fork(**kwargs) -> None:
+    """Drop pooled DB connections inherited from the parent process."""
+    engine.dispose(close=False)
+
+
+@task_postrun.connect
+def _remove_session(**kwargs) -> None:
+    """Return the task's connection to the pool."""
+    Session.remove()
+
 
 @celery_app.task(
+    name=PROCESS_SIMULATION_TASK,
     bind=True,
     max_retries=3,
     default_retry_delay=60,
@@ -38,33 +75,30 @@ def process_simulation(self, job_id: str) -> dict:
         Result metadata
     """
     logger.info(f"Processing simulation job {job_id}")
+    job_uuid = _parse_task_id(job_id)
     
-    db = SessionLocal()
-    blob_storage = S3Storage()
-    service = SimulationService(db, blob_storage)
+    db = Session()
+    blob_storage = _get_blob_storage()
+    service = SimulationService(db, blob_storage, _result_cache)
     
     try:
-        job_uuid = UUID(job_id)
-        
-        # Update status to RUNNING
-        service.update_job_status(job_uuid, SimulationStatus.RUNNING)
-        
-        # Get the job and its parameters
-        job = service.get_job_by_id(job_uuid)
+        # Mark the job RUNNING; the UPDATE returns the row, so it isn't
+        # read again
+        job = service.update_job_status(job_uuid, SimulationStatus.RUNNING)
         parameters = service.get_job_parameters(job)
         job_metadata = job.job_metadata
         
         # Get the appropriate handler for this simulation type
-        handler = SimulationHandlerRegistry.get_handler(job.simulation_type)
+        handler = get_simulation_handler(job.simulation_type)
         
         if handler:
             # Execute the simulation via the handler
             logger.info(f"Executing simulation {job_id} with handler for {job.simulation_type}")
-            result = handler.execute(
+            result = handler(
                 job_id=str(job.id),
                 simulation_type=job.simulation_type,
                 parameters=parameters,
-                progress_callback=lambda p: service.update_job_status(job_uuid, SimulationStatus.RUNNING, progress=p)
+                progress_callback=_throttled_progress(service, job_uuid),
             )
         else:
             # No handler registered - use default placeholder behavior
@@ -83,21 +117,24 @@ def process_simulation(self, job_id: str) -> dict:
     except Exception as e:
         logger.error(f"Simulation job {job_id} failed: {str(e)}")
         
+        # The failure may have left the shared session in a failed
+        # transaction; without this the FAILED update would raise
+        # PendingRollbackError and leave the job RUNNING
+        db.rollback()
+        
         # Update job status to FAILED
         service.update_job_status(
-            UUID(job_id),
+            job_uuid,
             SimulationStatus.FAILED,
             error_code="SIMULATION_ERROR",
             error_message=str(e)
         )
         
         raise
-        
-    finally:
-        db.close()
 
 
 @celery_app.task(
+    name=GENERATE_REPORT_TASK,
     bind=True,
     max_retries=3,
     default_retry_delay=60,
@@ -117,34 +154,36 @@ def generate_report(self, report_id: str) -> dict:
         Result metadata
     """
     logger.info(f"Generating report {report_id}")
+    report_uuid = _parse_task_id(report_id)
     
-    db = SessionLocal()
-    blob_storage = S3Storage()
+    db = Session()
+    blob_storage = _get_blob_storage()
     report_service = ReportService(db, blob_storage)
-    simulation_service = SimulationService(db, blob_storage)
+    simulation_service = SimulationService(db, blob_storage, _result_cache)
     
     try:
-        report_uuid = UUID(report_id)
-        
         # Update status to GENERATING
         report_service.update_report_status(report_uuid, ReportStatus.GENERATING)
         
         # Get the report
         report = report_service.get_report_by_id(report_uuid)
         
-        # Gather all simulation results
-        simulation_results = []
-        for sim_id in report.simulation_job_ids:
-            result = simulation_service.get_job_result(report.user_id, sim_id)
-            simulation_results.append(result)
+        # Gather all simulation results in one query plus parallel downloads
+        simulation_results = simulation_service.get_job_results_bulk(
+            report.user_id, report.simulation_job_ids
+        )
+        
+        # End the read transaction so the pooled connection isn't held
+        # idle while the handler runs and the file uploads
+        db.commit()
         
         # Get the appropriate handler for this report type
-        handler = ReportHandlerRegistry.get_handler(report.report_type)
+        handler = get_report_handler(report.report_type)
         
         if handler:
             # Generate the report via the handler
             logger.info(f"Generating report {report_id} with handler for {report.report_type}")
-            file_content, content_type, filename = handler.generate(
+            file_content, content_type, filename = handler(
                 report_id=str(report.id),
                 report_type=report.report_type,
                 output_format=report.output_format,
@@ -161,12 +200,18 @@ def generate_report(self, report_id: str) -> dict:
                 simulation_results,
             )
         
+        # Handlers may return bytes, a readable stream or byte chunks;
+        # either way the upload streams it rather than copying it
+        size_hint = len(file_content) if isinstance(file_content, (bytes, bytearray)) else None
+        file_stream = as_stream(file_content)
+        
         # Save the report file
         report_service.save_report_file(
             report_uuid,
-            file_content,
+            file_stream,
             content_type,
             filename,
+            size_hint=size_hint,
         )
         
         logger.info(f"Report {report_id} generated successfully")
@@ -175,32 +220,76 @@ def generate_report(self, report_id: str) -> dict:
     except Exception as e:
         logger.error(f"Report {report_id} generation failed: {str(e)}")
         
+        # As in process_simulation, clear any failed transaction first
+        db.rollback()
+        
         # Update report status to FAILED
         report_service.update_report_status(
-            UUID(report_id),
+            report_uuid,
             ReportStatus.FAILED,
             error_code="REPORT_ERROR",
             error_message=str(e)
         )
         
         raise
-        
-    finally:
-        db.close()
+
+
+def _parse_task_id(value: str) -> UUID:
+    """
+    Parse a task's job or report ID once, before any work starts.
+    
+    A malformed ID can never succeed, so the message is dropped with
+    Ignore instead of raising into autoretry and burning every retry.
+    """
+    try:
+        return UUID(value)
+    except ValueError:
+        logger.error(f"Dropping task with malformed ID: {value!r}")
+        raise Ignore()
+
+
+def _throttled_progress(service: SimulationService, job_uuid: UUID):
+    """
+    Build a progress callback that writes at most a few updates.
+    
+    Handlers may report progress on every iteration; each write is an
+    UPDATE, so ticks are dropped unless progress moved by at least
+    PROGRESS_UPDATE_MIN_DELTA or PROGRESS_UPDATE_INTERVAL seconds have
+    passed since the last write. The final result is written by
+    save_result either way.
+    """
+    last_progress = 0.0
+    last_write = time.monotonic()
+    
+    def report(progress: float) -> None:
+        nonlocal last_progress, last_write
+        now = time.monotonic()
+        if (
+            progress - last_progress < settings.PROGRESS_UPDATE_MIN_DELTA
+            and now - last_write < settings.PROGRESS_UPDATE_INTERVAL
+        ):
+            return
+        service.update_job_status(job_uuid, SimulationStatus.RUNNING, progress=progress)
+        last_progress, last_write = progress, now
+    
+    return report
 
 
 def _default_simulation_handler(simulation_type: str, parameters: dict) -> dict:
     """
     Default simulation handler for when no specific handler is registered.
     
-    This is a placeholder that simulates work and returns dummy results.
-    In production, either register proper handlers or integrate with
-    external simulation services.
+    This is a placeholder that returns dummy results; it only sleeps to
+    simulate work when SIMULATE_DEFAULT_WORK is set. In production,
+    either register proper handlers or integrate with external
+    simulation services.
     """
     logger.info(f"Running default simulation handler for type: {simulation_type}")
     
-    # Simulate some processing time
-    time.sleep(2)
+    # Simulate some processing time (opt-in, for demos)
+    processing_time = 2 if settings.SIMULATE_DEFAULT_WORK else 0
+    if processing_time:
+        time.sleep(processing_time)
     
     return {
         "simulation_type": simulation_type,
@@ -210,7 +299,7 @@ def _default_simulation_handler(simulation_type: str, parameters: dict) -> dict:
             "note": "Register a handler for this simulation type to get real results",
         },
         "metrics": {
-            "processing_time_seconds": 2,
+            "processing_time_seconds": processing_time,
         }
     }
 
@@ -228,8 +317,6 @@ def _default_report_handler(
     In production, either register proper handlers or integrate with
     external report generation services.
     """
-    import json
-    
     logger.info(f"Running default report handler for type: {report_type}")
     
     report_data = {
@@ -241,7 +328,7 @@ def _default_report_handler(
     }
     
     # For the default handler, always output JSON regardless of requested format
-    file_content = json.dumps(report_data, indent=2, default=str).encode("utf-8")
+    file_content = dumps_json(report_data, indent=True)
     content_type = "application/json"
     filename = f"report.json"
     
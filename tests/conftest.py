@@ -1,16 +1,24 @@
 """Pytest configuration and fixtures."""
 
+import os
+
+# Tests don't need slow password hashes; bcrypt's minimum cost is 4.
+# Set before the app, and with it the settings, is imported.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.db.base import Base
 from app.db.session import get_db
-from app.api.v1.dependencies import get_blob_storage
+from app.api.v1.dependencies import get_blob_storage, get_result_cache
+from app.api.v1.token_cache import clear_token_cache
 from app.storage.blob_storage import BlobStorage
+from app.storage.json_codec import dumps_json, loads_json
 
 
 # In-memory SQLite for testing
@@ -21,23 +29,35 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+
+# pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+# emit BEGIN itself so each test can run inside a rolled-back transaction
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_begin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
 
 
 class MockBlobStorage(BlobStorage):
     """Mock blob storage for testing."""
 
     def __init__(self):
-        self._storage = {}
+        self._storage: dict[str, bytes] = {}
 
     def upload_json(self, key: str, data: dict) -> str:
-        import json
-        self._storage[key] = json.dumps(data).encode()
+        self._storage[key] = dumps_json(data)
         return key
 
     def download_json(self, key: str) -> dict:
-        import json
-        return json.loads(self._storage[key].decode())
+        return loads_json(self._storage[key])
 
     def upload_file(self, key: str, file_obj, content_type: str) -> str:
         self._storage[key] = file_obj.read()
@@ -62,16 +82,32 @@ class MockBlobStorage(BlobStorage):
         return key in self._storage
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a fresh database session for each test."""
+@pytest.fixture(scope="session")
+def db_schema():
+    """Create the tables once for the whole test run."""
     Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def db_session(db_schema):
+    """
+    Create a database session whose changes are discarded after the test.
+
+    The session joins an outer transaction and turns its own commits into
+    SAVEPOINT releases, so rolling the outer transaction back leaves the
+    schema empty for the next test.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -95,11 +131,14 @@ def client(db_session, mock_blob_storage):
 
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_blob_storage] = override_get_blob_storage
+    # Results are always read from the mock blob storage
+    app.dependency_overrides[get_result_cache] = lambda: None
 
     with TestClient(app) as test_client:
         yield test_client
 
     app.dependency_overrides.clear()
+    clear_token_cache()
 
 
 @pytest.fixture
@@ -116,7 +155,7 @@ def test_user(client):
     # Login to get token
     login_response = client.post(
         "/api/v1/auth/login",
-        data={"username": user_data["email"], "password": user_data["password"]}
+        json={"email": user_data["email"], "password": user_data["password"]}
     )
     assert login_response.status_code == 200
 
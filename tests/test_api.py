@@ -1,6 +1,25 @@
 """API endpoint tests."""
 
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
 import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import scoped_session
+
+from app.api.v1.token_cache import cache_token, get_cached_token
+from app.handlers import SimulationHandler, SimulationHandlerRegistry, get_simulation_handler
+from app.models.report import Report, ReportStatus
+from app.models.simulation import SimulationJob, SimulationStatus
+from app.models.user import User
+from app.schemas.user import TokenPayload
+from app.services.exceptions import SimulationNotFoundError
+from app.services.report_service import ReportService
+from app.services.simulation_service import SimulationService
+from app.services.user_service import TokenVerifier, UserService
+from app.storage.json_codec import dumps_json, loads_json
+from app.workers import tasks
 
 
 class TestHealthCheck:
@@ -48,8 +67,8 @@ class TestAuth:
         """Test successful login."""
         response = client.post(
             "/api/v1/auth/login",
-            data={
-                "username": test_user["user_data"]["email"],
+            json={
+                "email": test_user["user_data"]["email"],
                 "password": test_user["user_data"]["password"]
             }
         )
@@ -58,12 +77,24 @@ class TestAuth:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
 
+    def test_login_form_alias(self, client, test_user):
+        """Test login through the OAuth2 form-encoded alias."""
+        response = client.post(
+            "/api/v1/auth/login/form",
+            data={
+                "username": test_user["user_data"]["email"],
+                "password": test_user["user_data"]["password"]
+            }
+        )
+        assert response.status_code == 200
+        assert "access_token" in response.json()
+
     def test_login_invalid_credentials(self, client, test_user):
         """Test login with invalid credentials."""
         response = client.post(
             "/api/v1/auth/login",
-            data={
-                "username": test_user["user_data"]["email"],
+            json={
+                "email": test_user["user_data"]["email"],
                 "password": "wrongpassword"
             }
         )
@@ -76,6 +107,39 @@ class TestAuth:
         data = response.json()
         assert data["email"] == "test@example.com"
 
+    def test_token_cache_hit_skips_verify_and_lookup(self, client, auth_headers, monkeypatch):
+        """Test a recently verified token is served without crypto or a DB query."""
+        assert client.get("/api/v1/auth/me", headers=auth_headers).status_code == 200
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cache hit should not reach this")
+
+        monkeypatch.setattr(TokenVerifier, "verify", fail)
+        monkeypatch.setattr(UserService, "get_user_by_id", fail)
+
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["email"] == "test@example.com"
+
+    def test_token_cache_respects_token_expiry(self, db_session):
+        """Test a cached token stops being served once its own exp has passed."""
+        user = User(id=uuid4(), email="cache@example.com", hashed_password="x", is_active=True)
+        cache_token("expired-token", TokenPayload(sub=str(user.id), exp=1), user)
+        cache_token("live-token", TokenPayload(sub=str(user.id), exp=4102444800), user)
+
+        assert get_cached_token("expired-token") is None
+        assert get_cached_token("live-token").user.id == user.id
+
+    def test_disabled_user_rejected(self, client, db_session, auth_headers):
+        """Test a disabled account is rejected on both cache miss and cache hit."""
+        db_session.query(User).update({User.is_active: False})
+        db_session.commit()
+
+        # First request misses the cache and caches the disabled user
+        assert client.get("/api/v1/auth/me", headers=auth_headers).status_code == 403
+        # Second request is a cache hit and must still be rejected
+        assert client.get("/api/v1/auth/me", headers=auth_headers).status_code == 403
+
 
 class TestSimulations:
     """Tests for simulation endpoints."""
@@ -152,6 +216,351 @@ class TestSimulations:
         data = response.json()
         assert len(data) == 3
 
+    def test_large_parameters_stored_in_blob_storage(
+        self, client, db_session, auth_headers, mock_blob_storage
+    ):
+        """Test oversized parameters are uploaded once and referenced."""
+        parameters = {"values": ["x" * 1024] * 128}
+        response = client.post(
+            "/api/v1/simulations",
+            headers=auth_headers,
+            json={"simulation_type": "test", "parameters": parameters},
+        )
+        assert response.status_code == 202
+
+        job = db_session.query(SimulationJob).one()
+        assert job.parameters == {"_s3_reference": True}
+        assert mock_blob_storage.download_json(job.parameters_s3_key) == parameters
+
+    def test_get_result_returns_stored_payload(
+        self, client, db_session, auth_headers, mock_blob_storage
+    ):
+        """Test a completed job's stored result is returned in the envelope."""
+        user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+        payload = {"values": [1, 2.5, "three"], "nested": {"ok": True}}
+        key = f"simulations/{user_id}/result.json"
+        mock_blob_storage.upload_json(key, payload)
+        job = SimulationJob(
+            id=uuid4(),
+            user_id=user_id,
+            simulation_type="test",
+            status=SimulationStatus.COMPLETED,
+            parameters={},
+            job_metadata={},
+            result_s3_key=key,
+        )
+        db_session.add(job)
+        db_session.commit()
+
+        response = client.get(f"/api/v1/simulations/{job.id}/result", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "COMPLETED"
+        assert data["result"] == payload
+
+    def test_get_result_of_pending_job(self, client, db_session, auth_headers):
+        """Test an unfinished job reports its status instead of a result."""
+        user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+        job = SimulationJob(
+            id=uuid4(),
+            user_id=user_id,
+            simulation_type="test",
+            status=SimulationStatus.RUNNING,
+            parameters={},
+            job_metadata={},
+        )
+        db_session.add(job)
+        db_session.commit()
+
+        response = client.get(f"/api/v1/simulations/{job.id}/result", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["result"] is None
+        assert data["message"] == "Simulation is running"
+
+    def test_bulk_results_keep_requested_order(
+        self, client, db_session, auth_headers, mock_blob_storage
+    ):
+        """Test bulk result fetches mix completed and pending jobs in order."""
+        user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+        jobs = []
+        for i, status in enumerate(
+            [SimulationStatus.COMPLETED, SimulationStatus.RUNNING, SimulationStatus.COMPLETED]
+        ):
+            key = None
+            if status == SimulationStatus.COMPLETED:
+                key = f"simulations/{user_id}/{i}/result.json"
+                mock_blob_storage.upload_json(key, {"index": i})
+            jobs.append(SimulationJob(
+                id=uuid4(),
+                user_id=user_id,
+                simulation_type="test",
+                status=status,
+                parameters={},
+                job_metadata={},
+                result_s3_key=key,
+            ))
+        db_session.add_all(jobs)
+        db_session.commit()
+
+        service = SimulationService(db_session, mock_blob_storage)
+        results = service.get_job_results_bulk(user_id, [job.id for job in reversed(jobs)])
+
+        assert [r["job_id"] for r in results] == [str(job.id) for job in reversed(jobs)]
+        assert results[0]["result"] == {"index": 2}
+        assert "result" not in results[1]
+        assert results[2]["result"] == {"index": 0}
+
+        with pytest.raises(SimulationNotFoundError):
+            service.get_job_results_bulk(user_id, [jobs[0].id, uuid4()])
+
+    def test_bulk_results_are_plain_json_for_handlers(
+        self, client, db_session, auth_headers, mock_blob_storage
+    ):
+        """Test report handlers receive string-typed, stdlib-serializable results."""
+        user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+        key = f"simulations/{user_id}/result.json"
+        mock_blob_storage.upload_json(key, {"value": 1})
+        completed_at = datetime(2026, 1, 2, 3, 4, 5)
+        done = SimulationJob(
+            id=uuid4(),
+            user_id=user_id,
+            simulation_type="test",
+            status=SimulationStatus.COMPLETED,
+            parameters={},
+            job_metadata={},
+            result_s3_key=key,
+            completed_at=completed_at,
+        )
+        pending = SimulationJob(
+            id=uuid4(),
+            user_id=user_id,
+            simulation_type="test",
+            status=SimulationStatus.PENDING,
+            parameters={},
+            job_metadata={},
+        )
+        db_session.add_all([done, pending])
+        db_session.commit()
+
+        service = SimulationService(db_session, mock_blob_storage)
+        results = service.get_job_results_bulk(user_id, [done.id, pending.id])
+
+        assert results == [
+            {
+                "job_id": str(done.id),
+                "status": "COMPLETED",
+                "result": {"value": 1},
+                "completed_at": "2026-01-02T03:04:05",
+            },
+            {
+                "job_id": str(pending.id),
+                "status": "PENDING",
+                "message": "Simulation is pending",
+            },
+        ]
+        json.dumps(results)
+        assert service.get_job_result(user_id, done.id) == results[0]
+
+    def test_list_simulations_by_tag(self, client, auth_headers):
+        """Test filtering on the promoted job_metadata tag."""
+        for tag in ("production", "staging", "x" * 65):
+            client.post(
+                "/api/v1/simulations",
+                headers=auth_headers,
+                json={
+                    "simulation_type": "test",
+                    "parameters": {},
+                    "job_metadata": {"tag": tag},
+                }
+            )
+
+        response = client.get(
+            "/api/v1/simulations", headers=auth_headers, params={"tag": "production"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [job["job_metadata"]["tag"] for job in data] == ["production"]
+
+    def test_list_simulations_cursor(self, client, db_session, auth_headers):
+        """Test following X-Next-Cursor pages through jobs newest first."""
+        user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+        base = datetime(2024, 1, 1, 12, 0, 0)
+        jobs = [
+            SimulationJob(
+                id=uuid4(),
+                user_id=user_id,
+                simulation_type="test",
+                status=SimulationStatus.PENDING,
+                parameters={},
+                job_metadata={},
+                created_at=base + timedelta(seconds=i // 2),
+            )
+            for i in range(5)
+        ]
+        db_session.add_all(jobs)
+        db_session.commit()
+        expected = [
+            str(job.id)
+            for job in sorted(jobs, key=lambda j: (j.created_at, j.id), reverse=True)
+        ]
+
+        seen = []
+        params = {"limit": 2}
+        for _ in range(len(expected)):
+            response = client.get("/api/v1/simulations", headers=auth_headers, params=params)
+            assert response.status_code == 200
+            seen.extend(item["id"] for item in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            params = {"limit": 2, "cursor": cursor}
+
+        assert seen == expected
+
+
+class TestHandlerRegistry:
+    """Tests for handler registration and parameter validation."""
+
+    @pytest.fixture
+    def class_handler(self):
+        """Register a class-based simulation handler for the test."""
+
+        class EchoHandler(SimulationHandler):
+            def execute(self, job_id, simulation_type, parameters, progress_callback=None):
+                return {"echo": parameters}
+
+            def validate_parameters(self, parameters):
+                return "iterations" in parameters
+
+        handler = EchoHandler()
+        SimulationHandlerRegistry.register("echo", handler)
+        yield handler
+        SimulationHandlerRegistry.unregister("echo")
+
+    def test_class_based_handler_dispatches_to_execute(self, class_handler):
+        """Test an ABC handler instance is stored as its bound execute method."""
+        assert SimulationHandlerRegistry.get_handler("echo") is class_handler
+        execute = get_simulation_handler("echo")
+        assert execute(job_id="j", simulation_type="echo", parameters={"a": 1}) == {
+            "echo": {"a": 1}
+        }
+
+    def test_validator_rejects_submission(self, client, auth_headers, class_handler):
+        """Test a handler's validate_parameters is applied when a job is submitted."""
+        rejected = client.post(
+            "/api/v1/simulations",
+            headers=auth_headers,
+            json={"simulation_type": "echo", "parameters": {}},
+        )
+        assert rejected.status_code == 422
+
+        accepted = client.post(
+            "/api/v1/simulations",
+            headers=auth_headers,
+            json={"simulation_type": "echo", "parameters": {"iterations": 10}},
+        )
+        assert accepted.status_code == 202
+
+
+class TestWorkerTasks:
+    """Tests for the Celery task bodies, run eagerly."""
+
+    def test_database_error_marks_job_failed(
+        self, client, db_session, auth_headers, mock_blob_storage, monkeypatch
+    ):
+        """Test a handler's SQLAlchemyError still ends with the job FAILED."""
+        user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+        job = SimulationJob(
+            id=uuid4(),
+            user_id=user_id,
+            simulation_type="db_error",
+            status=SimulationStatus.PENDING,
+            parameters={},
+            job_metadata={},
+        )
+        db_session.add(job)
+        db_session.commit()
+
+        def failing_handler(job_id, simulation_type, parameters, progress_callback=None):
+            # A NOT NULL violation on flush leaves the session needing a rollback
+            db_session.add(User(id=uuid4(), email=None, hashed_password="x"))
+            db_session.flush()
+
+        monkeypatch.setattr(tasks, "Session", scoped_session(lambda: db_session))
+        monkeypatch.setattr(tasks, "_get_blob_storage", lambda: mock_blob_storage)
+        monkeypatch.setattr(tasks, "_result_cache", None)
+        SimulationHandlerRegistry.register("db_error", execute=failing_handler)
+        try:
+            result = tasks.process_simulation.apply(args=(str(job.id),))
+        finally:
+            SimulationHandlerRegistry.unregister("db_error")
+
+        assert isinstance(result.result, IntegrityError)
+        failed = db_session.get(SimulationJob, job.id, populate_existing=True)
+        assert failed.status == SimulationStatus.FAILED
+        assert failed.error_code == "SIMULATION_ERROR"
+
+
+class TestConditionalGet:
+    """Tests for ETag / If-None-Match on polled endpoints."""
+
+    @pytest.fixture
+    def job_url(self, client, db_session, auth_headers):
+        user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+        job = SimulationJob(
+            id=uuid4(),
+            user_id=user_id,
+            simulation_type="test",
+            status=SimulationStatus.PENDING,
+            parameters={},
+            job_metadata={},
+        )
+        db_session.add(job)
+        db_session.commit()
+        return f"/api/v1/simulations/{job.id}"
+
+    def test_status_emits_etag(self, client, auth_headers, job_url):
+        """Test the status endpoint returns an ETag."""
+        response = client.get(job_url, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"PENDING-')
+
+    @pytest.mark.parametrize(
+        "header",
+        ["{etag}", "W/{etag}", '"stale", {etag}', "*"],
+    )
+    def test_matching_if_none_match_returns_304(self, client, auth_headers, job_url, header):
+        """Test exact, weak, listed and wildcard tags all match."""
+        etag = client.get(job_url, headers=auth_headers).headers["ETag"]
+
+        response = client.get(
+            job_url, headers={**auth_headers, "If-None-Match": header.format(etag=etag)}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    def test_changed_job_returns_200(self, client, db_session, auth_headers, job_url):
+        """Test a stale tag gets the full body once the job changes."""
+        etag = client.get(job_url, headers=auth_headers).headers["ETag"]
+        db_session.query(SimulationJob).update({SimulationJob.status: SimulationStatus.RUNNING})
+        db_session.commit()
+
+        response = client.get(job_url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["status"] == "RUNNING"
+        assert response.headers["ETag"] != etag
+
+    def test_report_supports_if_none_match(self, client, db_session, auth_headers):
+        """Test the report endpoint honours its ETag too."""
+        expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        report_url = f"/api/v1/reports/{_completed_report(client, db_session, auth_headers, expires)}"
+        etag = client.get(report_url, headers=auth_headers).headers["ETag"]
+
+        response = client.get(report_url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
 
 class TestReports:
     """Tests for report endpoints."""
@@ -181,6 +590,55 @@ class TestReports:
         )
         assert response.status_code == 400
 
+    def test_create_report_unknown_simulation(self, client, auth_headers):
+        """Test that creating report with a non-existent simulation fails."""
+        fake_id = "00000000-0000-0000-0000-000000000000"
+        response = client.post(
+            "/api/v1/reports",
+            headers=auth_headers,
+            json={
+                "simulation_job_ids": [fake_id, fake_id],
+                "report_type": "summary",
+                "output_format": "PDF"
+            }
+        )
+        assert response.status_code == 404
+
+    def test_create_report_keeps_source_order(self, client, db_session, auth_headers, monkeypatch):
+        """Test source simulation ids keep request order with duplicates dropped."""
+        monkeypatch.setattr(ReportService, "_enqueue_report", lambda self, report_id: None)
+        user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+        jobs = [
+            SimulationJob(
+                id=uuid4(),
+                user_id=user_id,
+                simulation_type="test",
+                status=SimulationStatus.COMPLETED,
+                parameters={},
+                job_metadata={},
+            )
+            for _ in range(3)
+        ]
+        db_session.add_all(jobs)
+        db_session.commit()
+        first, second, third = (str(job.id) for job in jobs)
+
+        response = client.post(
+            "/api/v1/reports",
+            headers=auth_headers,
+            json={
+                "simulation_job_ids": [third, first, third, second, first],
+                "report_type": "summary",
+                "output_format": "PDF"
+            }
+        )
+        assert response.status_code == 202
+        assert response.json()["simulation_job_ids"] == [third, first, second]
+
+        report_id = response.json()["id"]
+        response = client.get(f"/api/v1/reports/{report_id}", headers=auth_headers)
+        assert response.json()["simulation_job_ids"] == [third, first, second]
+
     def test_get_report_not_found(self, client, auth_headers):
         """Test getting non-existent report."""
         fake_id = "00000000-0000-0000-0000-000000000000"
@@ -193,3 +651,146 @@ class TestReports:
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 0
+
+
+def _seed_reports(client, db_session, auth_headers, count):
+    """Insert reports for the current user and return their ids newest first."""
+    user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    reports = [
+        Report(
+            id=uuid4(),
+            user_id=user_id,
+            report_type="summary",
+            output_format="PDF",
+            status=ReportStatus.PENDING,
+            parameters={},
+            # Pairs share a timestamp so the id tie-breaker is exercised
+            created_at=base + timedelta(seconds=i // 2),
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(reports)
+    db_session.commit()
+    ordered = sorted(reports, key=lambda r: (r.created_at, r.id), reverse=True)
+    return [str(r.id) for r in ordered]
+
+
+def _completed_report(client, db_session, auth_headers, url_expires_at):
+    """Insert a completed report holding a previously signed download URL."""
+    user_id = UUID(client.get("/api/v1/auth/me", headers=auth_headers).json()["id"])
+    report = Report(
+        id=uuid4(),
+        user_id=user_id,
+        report_type="summary",
+        output_format="PDF",
+        status=ReportStatus.COMPLETED,
+        parameters={},
+        s3_key=f"reports/{user_id}/report.pdf",
+        download_url="http://stored-url/report.pdf",
+        url_expires_at=url_expires_at,
+    )
+    db_session.add(report)
+    db_session.commit()
+    return str(report.id)
+
+
+class TestReportDownloadUrl:
+    """Tests for reuse and re-signing of stored download URLs."""
+
+    def test_fresh_url_is_reused(self, client, db_session, auth_headers):
+        """Test a stored URL with time left is served as-is."""
+        expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        report_id = _completed_report(client, db_session, auth_headers, expires)
+
+        response = client.get(f"/api/v1/reports/{report_id}", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["download_url"] == "http://stored-url/report.pdf"
+
+    def test_expiring_url_is_re_signed(self, client, db_session, auth_headers):
+        """Test a stored URL inside the refresh margin is re-signed and persisted."""
+        expires = datetime.now(timezone.utc) + timedelta(seconds=10)
+        report_id = _completed_report(client, db_session, auth_headers, expires)
+
+        response = client.get(f"/api/v1/reports/{report_id}", headers=auth_headers)
+        assert response.status_code == 200
+        url = response.json()["download_url"]
+        assert url.startswith("http://mock-storage/reports/")
+
+        db_session.expire_all()
+        assert db_session.get(Report, UUID(report_id)).download_url == url
+
+    def test_list_omits_stored_urls(self, client, db_session, auth_headers):
+        """Test the list view never serves stored (possibly expired) URLs."""
+        expires = datetime.now(timezone.utc) - timedelta(hours=1)
+        _completed_report(client, db_session, auth_headers, expires)
+
+        response = client.get("/api/v1/reports", headers=auth_headers)
+        assert response.status_code == 200
+        [item] = response.json()
+        assert item["download_url"] is None
+        assert item["url_expires_at"] is None
+
+
+class TestReportPagination:
+    """Tests for keyset pagination of the report list."""
+
+    def test_cursor_walks_all_pages(self, client, db_session, auth_headers):
+        """Test following X-Next-Cursor returns every report exactly once, in order."""
+        expected = _seed_reports(client, db_session, auth_headers, 5)
+
+        seen = []
+        params = {"limit": 2}
+        for _ in range(len(expected)):
+            response = client.get("/api/v1/reports", headers=auth_headers, params=params)
+            assert response.status_code == 200
+            seen.extend(item["id"] for item in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            params = {"limit": 2, "cursor": cursor}
+
+        assert seen == expected
+
+    def test_no_cursor_when_last_page_is_full(self, client, db_session, auth_headers):
+        """Test a final page holding exactly `limit` rows has no next cursor."""
+        _seed_reports(client, db_session, auth_headers, 2)
+        response = client.get("/api/v1/reports", headers=auth_headers, params={"limit": 2})
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_cursor_takes_precedence_over_offset(self, client, db_session, auth_headers):
+        """Test offset is ignored when a cursor is given."""
+        expected = _seed_reports(client, db_session, auth_headers, 4)
+        first = client.get("/api/v1/reports", headers=auth_headers, params={"limit": 2})
+        cursor = first.headers["X-Next-Cursor"]
+
+        response = client.get(
+            "/api/v1/reports",
+            headers=auth_headers,
+            params={"limit": 2, "cursor": cursor, "offset": 1},
+        )
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == expected[2:]
+
+    def test_malformed_cursor(self, client, auth_headers):
+        """Test an undecodable cursor is rejected."""
+        response = client.get(
+            "/api/v1/reports", headers=auth_headers, params={"cursor": "not-a-cursor"}
+        )
+        assert response.status_code == 400
+
+
+class TestJsonCodec:
+    """Tests for the stored-payload JSON encoder."""
+
+    def test_fallback_encodes_datetimes_like_orjson(self):
+        """Test the stdlib fallback writes datetimes in orjson's format."""
+        when = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        fast = dumps_json({"at": when})
+        # Integers wider than 64 bits force the stdlib encoder
+        slow = dumps_json({"at": when, "big": 2**70})
+
+        assert loads_json(fast)["at"] == "2024-01-02T03:04:05+00:00"
+        assert json.loads(slow)["at"] == loads_json(fast)["at"]